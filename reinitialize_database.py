@@ -2,21 +2,21 @@
 重新初始化向量数据库脚本
 删除现有数据库并重新创建，确保包含所有最新模板
 """
-import sys
 import os
 import shutil
 import json
 import re
 
-# 添加 src 目录到 Python 路径
 project_root = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
 
 # 直接使用 ChromaDB，避免导入 crewai
 import chromadb
 from chromadb.config import Settings
 
+# knowledge_sync 只依赖标准库；在删除数据库之前导入，导入失败不会留下空库
+from autolatex.knowledge_sync import sync_templates
+
 def extract_template_knowledge():
     """直接从文件提取 LATEX_TEMPLATE_KNOWLEDGE 数据"""
     knowledge_file = os.path.join(src_path, "autolatex", "tools", "knowledge_base.py")
@@ -112,17 +112,9 @@ def reinitialize_database():
         traceback.print_exc()
         return
     
-    # 添加所有模板
+    # 添加所有模板（ID 与 metadata 的生成方式与 initialize_knowledge_base 一致）
     print("\n正在添加模板到数据库...")
-    documents = [item["document"] for item in LATEX_TEMPLATE_KNOWLEDGE]
-    metadatas = [item["metadata"] for item in LATEX_TEMPLATE_KNOWLEDGE]
-    ids = [f"template_{item['journal'].lower().replace(' ', '_')}" for item in LATEX_TEMPLATE_KNOWLEDGE]
-    
-    collection.add(
-        documents=documents,
-        metadatas=metadatas,
-        ids=ids
-    )
+    sync_templates(collection, LATEX_TEMPLATE_KNOWLEDGE)
     
     count = collection.count()
     print(f"\n✅ 数据库重新初始化成功！")
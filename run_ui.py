@@ -1,22 +1,14 @@
 """
 启动 Gradio Web UI
 """
-import sys
-import os
+import uvicorn
 
-# 添加 src 目录到 Python 路径
-project_root = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
-
-from autolatex.web_ui import create_ui
+from autolatex.web_ui import create_app
 
 if __name__ == "__main__":
-    demo = create_ui()
-    demo.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=False,
-        show_error=True
+    uvicorn.run(
+        create_app(),
+        host="0.0.0.0",
+        port=7860
     )
 
@@ -3,27 +3,33 @@ FastAPI 后端服务
 提供 AutoLaTeX 的 RESTful API 接口
 """
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import os
-import sys
 import uuid
 import re
 import zipfile
 import shutil
 from urllib.parse import quote
 
-# 添加 src 目录到路径（从 api/main.py 向上两级到 src）
+# 项目根目录（src/autolatex/api/main.py 向上三级），上传文件与输出目录都相对于它
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
-src_path = os.path.join(project_root, 'src')
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
 
 from autolatex.tools.knowledge_base import knowledge_base_search, initialize_knowledge_base, get_all_journal_names
 from autolatex.crew import Autolatex
 
+# 上传文件落盘时的分块大小，避免把整个文件读入内存
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def _save_upload(upload: UploadFile, path: str) -> None:
+    """将上传文件分块写入磁盘（阻塞 I/O，由 run_in_threadpool 放到线程池执行，不阻塞事件循环）"""
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload.file, f, UPLOAD_CHUNK_SIZE)
+
 app = FastAPI(
     title="AutoLaTeX API",
     description="AutoLaTeX 论文自动转换服务 API",
@@ -39,6 +45,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 对超过 1KB 的响应启用 gzip 压缩（客户端需发送 Accept-Encoding: gzip）
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # 初始化知识库
 print("正在初始化知识库...")
 try:
@@ -77,6 +86,11 @@ class PaperConvertResponse(BaseModel):
     tex_zip_url: Optional[str] = None
     error: Optional[str] = None
 
+class PaperUploadConvertResponse(PaperConvertResponse):
+    """上传并转换论文响应"""
+    file_path: Optional[str] = None
+    filename: Optional[str] = None
+
 # ==================== API 端点 ====================
 
 @app.get("/")
@@ -90,6 +104,7 @@ async def root():
             "knowledge_search": "/api/v1/knowledge/search",
             "knowledge_journals": "/api/v1/knowledge/journals",
             "paper_convert": "/api/v1/paper/convert",
+            "paper_upload_and_convert": "/api/v1/paper/upload_and_convert",
             "health": "/api/v1/health"
         }
     }
@@ -309,9 +324,7 @@ async def upload_paper(request: Request):
         
         # 保存文档文件到文件文件夹中
         file_path = os.path.abspath(os.path.join(file_folder, file.filename))
-        file_content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        await run_in_threadpool(_save_upload, file, file_path)
         print(f"[API] 保存文档: {file.filename} -> {file_path}")
         
         # 获取并保存所有图片文件到 equation 文件夹
@@ -348,9 +361,7 @@ async def upload_paper(request: Request):
                         counter += 1
                     
                     # 保存图片
-                    image_content = await image_file.read()
-                    with open(image_path, "wb") as img_f:
-                        img_f.write(image_content)
+                    await run_in_threadpool(_save_upload, image_file, image_path)
                     
                     saved_image_paths.append(image_path)
                     print(f"[API] 保存图片: {image_file.filename} -> {image_path}")
@@ -375,6 +386,33 @@ async def upload_paper(request: Request):
         print(f"[API] 上传错误: {error_trace}")
         raise HTTPException(status_code=500, detail=f"文件上传失败: {str(e)}")
 
+@app.post("/api/v1/paper/upload_and_convert", response_model=PaperUploadConvertResponse)
+async def upload_and_convert_paper(request: Request):
+    """
+    上传并转换论文
+    
+    在一个 multipart/form-data 请求中完成上传和转换（字段: file, journal_name, topic, image_0, ...），
+    客户端只需一次往返
+    """
+    form = await request.form()
+    journal_name = str(form.get("journal_name") or "").strip()
+    topic = str(form.get("topic") or "").strip() or None
+    
+    # 复用上传逻辑（request.form() 的结果已被缓存，不会重复解析）
+    upload_data = await upload_paper(request)
+    
+    result = await convert_paper(PaperConvertRequest(
+        file_path=upload_data["file_path"],
+        journal_name=journal_name,
+        topic=topic,
+        image_paths=upload_data["image_paths"] or None,
+    ))
+    return PaperUploadConvertResponse(
+        **result.model_dump(),
+        file_path=upload_data["file_path"],
+        filename=upload_data["filename"],
+    )
+
 @app.get("/api/v1/paper/download")
 async def download_pdf(filename: str):
     """
@@ -0,0 +1,120 @@
+"""
+知识库模板同步模块
+
+生成模板 ID 与 metadata，并按内容哈希把模板同步到 ChromaDB 集合。
+只依赖标准库，reinitialize_database.py 等脚本可以直接导入，
+而不会经由 autolatex.tools 引入 crewai。
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+def _clean_metadata(metadata: Dict) -> Dict:
+    """
+    清理 metadata，将嵌套字典转换为 JSON 字符串
+    
+    ChromaDB 的 metadata 只支持基本类型（str, int, float, bool, None），
+    不支持嵌套字典或列表。需要将嵌套结构转换为 JSON 字符串。
+    
+    Args:
+        metadata: 原始 metadata 字典
+        
+    Returns:
+        清理后的 metadata 字典
+    """
+    cleaned = {}
+    for key, value in metadata.items():
+        if isinstance(value, (dict, list)):
+            # 将嵌套字典或列表转换为 JSON 字符串
+            cleaned[key] = json.dumps(value, ensure_ascii=False)
+        else:
+            # 基本类型直接保留
+            cleaned[key] = value
+    return cleaned
+
+# 旧 ID 方案（template_<期刊名小写>）的前缀，这类条目会在同步时被替换为新 ID
+LEGACY_TEMPLATE_ID_PREFIX = "template_"
+
+def template_id(journal: str) -> str:
+    """
+    根据期刊名称生成模板 ID
+    
+    使用 blake2b 短哈希，避免拼写相近的期刊名（大小写、空格差异）映射到同一个 ID。
+    """
+    return "t_" + hashlib.blake2b(journal.encode("utf-8"), digest_size=8).hexdigest()
+
+def template_metadata(item: Dict) -> Dict:
+    """
+    生成写入向量数据库的模板 metadata
+    
+    在清理后的 metadata 中附加 content_hash（文档与原始 metadata 的哈希），
+    用于判断已入库的模板内容是否发生变化。
+    """
+    payload = item["document"] + json.dumps(item["metadata"], sort_keys=True, ensure_ascii=False)
+    metadata = _clean_metadata(item["metadata"])
+    metadata["content_hash"] = hashlib.blake2b(payload.encode("utf-8")).hexdigest()[:16]
+    return metadata
+
+
+@dataclass(slots=True)
+class SyncResult:
+    """一次模板同步的结果"""
+    added: List[str] = field(default_factory=list)  # 新增的期刊名
+    updated: List[str] = field(default_factory=list)  # 内容有变化、被覆盖的期刊名
+    removed: List[str] = field(default_factory=list)  # 删除的旧 ID
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+def sync_templates(collection: Any, templates: List[Dict]) -> SyncResult:
+    """
+    按内容哈希把模板同步到 ChromaDB 集合
+    
+    缺失或内容有变化的模板通过一次 upsert 写入，哈希一致的模板不会重新计算向量；
+    旧 ID 方案留下的 template_* 条目一次性删除。
+    
+    Args:
+        collection: ChromaDB 集合
+        templates: LATEX_TEMPLATE_KNOWLEDGE 格式的模板列表
+        
+    Returns:
+        SyncResult
+    """
+    # 只取元数据，不传输文档和向量
+    existing = collection.get(include=["metadatas"])
+    existing_hashes = {
+        doc_id: (metadata or {}).get("content_hash")
+        for doc_id, metadata in zip(existing["ids"], existing["metadatas"])
+    }
+    
+    result = SyncResult()
+    documents = []
+    metadatas = []
+    ids = []
+    for item in templates:
+        doc_id = template_id(item["journal"])
+        metadata = template_metadata(item)
+        if doc_id not in existing_hashes:
+            result.added.append(item["journal"])
+        elif existing_hashes[doc_id] != metadata["content_hash"]:
+            result.updated.append(item["journal"])
+        else:
+            continue
+        documents.append(item["document"])
+        metadatas.append(metadata)
+        ids.append(doc_id)
+    
+    if ids:
+        collection.upsert(documents=documents, metadatas=metadatas, ids=ids)
+    
+    legacy_ids = [doc_id for doc_id in existing_hashes if doc_id.startswith(LEGACY_TEMPLATE_ID_PREFIX)]
+    if legacy_ids:
+        try:
+            collection.delete(ids=legacy_ids)
+            result.removed = legacy_ids
+        except Exception as e:
+            print(f"删除旧 ID 条目时出错: {e}")
+    
+    return result
@@ -0,0 +1,131 @@
+// 确保函数在全局作用域中定义
+// 折叠/展开只切换 body 上的 sidebar-collapsed 类，具体样式由 autotex.css 控制
+window.toggleSidebar = function() {
+    if (!document.getElementById('expand-sidebar-btn')) {
+        const expandBtn = document.createElement('div');
+        expandBtn.id = 'expand-sidebar-btn';
+        expandBtn.className = 'expand-sidebar-btn';
+        expandBtn.textContent = '→';
+        document.body.appendChild(expandBtn);
+    }
+    document.body.classList.add('sidebar-collapsed');
+};
+
+window.showSidebar = function() {
+    document.body.classList.remove('sidebar-collapsed');
+};
+
+(function() {
+    const HIDDEN_LINK_SELECTOR = 'a[href*="/api"], a[href*="/gradio"], a[href*="/settings"]';
+    const HIDDEN_LINK_TEXTS = ['APIを介して使用', 'Gradioで作成', '設定'];
+    
+    // 等待 DOM 加载完成
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initLayout);
+    } else {
+        initLayout();
+    }
+    
+    // 隐藏链接（如果是单独的链接容器，也隐藏父元素）
+    function hideLink(link) {
+        link.style.display = 'none';
+        if (link.parentElement && link.parentElement.tagName === 'SPAN') {
+            link.parentElement.style.display = 'none';
+        }
+    }
+    
+    // 按文本匹配需要遍历所有链接，只在页面加载完成后执行一次
+    function hideLinksByText() {
+        const matched = [];
+        document.querySelectorAll('a').forEach(link => {
+            const text = link.textContent || '';
+            if (HIDDEN_LINK_TEXTS.some(t => text.includes(t))) {
+                matched.push(link);
+            }
+        });
+        requestAnimationFrame(() => matched.forEach(hideLink));
+    }
+    
+    function initLayout() {
+        // 先集中读取 DOM，再在同一帧内统一写入样式，避免读写交错引起强制同步布局
+        const sidebar = document.querySelector('.sidebar');
+        const mainContent = document.querySelector('.main-content');
+        const gradioContainer = document.querySelector('.gradio-container');
+        const footerContainers = document.querySelectorAll('footer, .gradio-footer');
+        
+        // 只查询指向 Gradio API/设置页的链接，而不是遍历页面上所有链接
+        const hiddenLinks = document.querySelectorAll(HIDDEN_LINK_SELECTOR);
+        
+        requestAnimationFrame(() => {
+            // 确保侧边栏固定在左侧
+            if (sidebar) {
+                sidebar.style.position = 'fixed';
+                sidebar.style.left = '0';
+                sidebar.style.top = '0';
+                sidebar.style.height = '100vh';
+                sidebar.style.zIndex = '1000';
+            }
+            
+            // 调整主内容区域的左边距
+            if (mainContent) {
+                mainContent.style.marginLeft = '250px';
+            }
+            
+            // 调整 Gradio 容器
+            if (gradioContainer) {
+                gradioContainer.style.maxWidth = '100%';
+                gradioContainer.style.padding = '0';
+            }
+            
+            hiddenLinks.forEach(hideLink);
+            
+            // 隐藏整个页脚容器（包括 Gradio 页脚链接）
+            footerContainers.forEach(container => {
+                container.style.display = 'none';
+            });
+        });
+    }
+    
+    // 监听 Gradio 加载完成事件
+    window.addEventListener('load', initLayout);
+    // 脚本可能在 load 事件之后才被注入，此时直接执行一次
+    if (document.readyState === 'complete') {
+        hideLinksByText();
+    } else {
+        window.addEventListener('load', hideLinksByText);
+    }
+    
+    // 使用 MutationObserver 监听 DOM 变化
+    // Gradio 会频繁修改 DOM，这里合并同一帧内的回调，每帧最多处理一次
+    let layoutPending = false;
+    const observer = new MutationObserver(function(mutations) {
+        if (layoutPending) {
+            return;
+        }
+        layoutPending = true;
+        requestAnimationFrame(() => {
+            layoutPending = false;
+            initLayout();
+        });
+    });
+    
+    // Gradio 的页脚和组件渲染在深层节点中，仍需监听整个子树
+    observer.observe(document.body, {
+        childList: true,
+        subtree: true
+    });
+    
+    // 使用事件委托处理折叠/展开按钮点击，只需在 document 上绑定一次
+    document.addEventListener('click', function(e) {
+        if (e.target && (e.target.id === 'sidebar-toggle' || e.target.classList.contains('collapse-icon'))) {
+            e.preventDefault();
+            e.stopPropagation();
+            window.toggleSidebar();
+        }
+        if (e.target && e.target.id === 'expand-sidebar-btn') {
+            e.preventDefault();
+            e.stopPropagation();
+            window.showSidebar();
+        }
+    });
+})();
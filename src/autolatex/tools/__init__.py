@@ -2,12 +2,13 @@
 工具模块
 """
 from .knowledge_tools import KnowledgeBaseSearchTool
-from .vector_db import VectorDatabase
+from .vector_db import SearchHit, VectorDatabase
 from .knowledge_base import knowledge_base_search, initialize_knowledge_base
 from .mixtex_ocr_tool import MixTexOCRTool
 
 __all__ = [
     "KnowledgeBaseSearchTool",
+    "SearchHit",
     "VectorDatabase",
     "knowledge_base_search",
     "initialize_knowledge_base",
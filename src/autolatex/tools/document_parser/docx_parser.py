@@ -5,13 +5,12 @@ from __future__ import annotations
 import os
 import re
 import uuid
+from collections import deque
 from typing import Any, Dict, List, Optional
 
 from docx import Document  # type: ignore
 from docx.document import Document as DocxDocument  # type: ignore
 from docx.oxml.ns import qn  # type: ignore
-from docx.oxml.table import CT_Tbl  # type: ignore
-from docx.oxml.text.paragraph import CT_P  # type: ignore
 from docx.table import _Cell, Table  # type: ignore
 from docx.text.paragraph import Paragraph  # type: ignore
 
@@ -20,6 +19,13 @@ CAPTION_PATTERN = re.compile(
     r"^(表|table|图|figure)\s*[\d一二三四五六七八九十0-9\.-]*[:：．.\s-]*(.+)",
     re.IGNORECASE
 )
+_P_TAG = qn("w:p")
+_TBL_TAG = qn("w:tbl")
+_SDT_TAG = qn("w:sdt")
+_SDT_CONTENT_TAG = qn("w:sdtContent")
+_SDT_DOC_PART_PATH = f"{qn('w:sdtPr')}/{qn('w:docPartObj')}"
+_BLOCK_TAGS = (_P_TAG, _TBL_TAG, _SDT_TAG)
+_BLOCK_FACTORIES = {_P_TAG: Paragraph, _TBL_TAG: Table}
 
 
 def _ensure_dir(path: str) -> None:
@@ -53,12 +59,25 @@ def _save_image(image_part) -> str:
 
 
 def _iter_block_items(parent: DocxDocument):
-    """遍历文档中的段落和表格（保持原始顺序）。"""
-    for child in parent.element.body:
-        if isinstance(child, CT_P):
-            yield Paragraph(child, parent)
-        elif isinstance(child, CT_Tbl):
-            yield Table(child, parent)
+    """遍历文档中的段落和表格（保持原始顺序）。
+
+    由 lxml 在 C 层按标签过滤正文子节点，跳过 sectPr、书签等无关元素。
+    使用显式栈做深度优先遍历：内容控件（w:sdt）的 sdtContent 子节点按原顺序
+    压回栈顶继续展开，不依赖递归。目录、封面等文档部件（docPartObj）不属于正文，
+    直接跳过，避免目录中的“参考文献”条目被误判为参考文献区域。
+    """
+    stack = deque(parent.element.body.iterchildren(*_BLOCK_TAGS))
+    while stack:
+        elem = stack.popleft()
+        factory = _BLOCK_FACTORIES.get(elem.tag)
+        if factory is not None:
+            yield factory(elem, parent)
+            continue
+        if elem.find(_SDT_DOC_PART_PATH) is not None:
+            continue
+        content = elem.find(_SDT_CONTENT_TAG)
+        if content is not None:
+            stack.extendleft(reversed(list(content.iterchildren(*_BLOCK_TAGS))))
 
 
 def _guess_heading_level(style_name: str) -> Optional[int]:
@@ -21,6 +21,12 @@ except ImportError:  # pragma: no cover
     )
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
 # 文件扩展名到解析函数的映射
 _PARSER_MAP: Dict[str, Callable[[str], Dict[str, Any]]] = {
     ".docx": parse_docx_to_json,
@@ -29,6 +35,16 @@ _PARSER_MAP: Dict[str, Callable[[str], Dict[str, Any]]] = {
 }
 
 
+def _dump_json(data: Dict[str, Any], output_path: str) -> None:
+    """以缩进格式写出 JSON；安装了 orjson 时直接写出 UTF-8 字节，避免构建中间字符串。"""
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 class DocumentParserTool(BaseTool):
     """文档解析工具，支持 DOCX、Markdown 和 TXT 格式。"""
 
@@ -70,8 +86,7 @@ class DocumentParserTool(BaseTool):
             base_name = os.path.splitext(os.path.basename(file_path))[0]
             output_path = os.path.join(dir_name, f"{base_name}_parsed.json")
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(parsed_dict, f, ensure_ascii=False, indent=2)
+            _dump_json(parsed_dict, output_path)
 
             print(f"[DocumentParserTool] 解析结果已保存至: {output_path}")
 
@@ -2,9 +2,10 @@
 知识库初始化和管理模块
 """
 import os
-import json
-from typing import List, Dict
-from .vector_db import VectorDatabase
+import time
+from typing import Dict, List, Tuple
+from .vector_db import SearchHit, VectorDatabase
+from ..knowledge_sync import sync_templates
 
 # LaTeX 模板知识库数据
 LATEX_TEMPLATE_KNOWLEDGE = [
@@ -379,29 +380,6 @@ Scientific Reports LaTeX 模版核心规范（基于官方 wlscirep.cls）：
     }
 ]
 
-def _clean_metadata(metadata: Dict) -> Dict:
-    """
-    清理 metadata，将嵌套字典转换为 JSON 字符串
-    
-    ChromaDB 的 metadata 只支持基本类型（str, int, float, bool, None），
-    不支持嵌套字典或列表。需要将嵌套结构转换为 JSON 字符串。
-    
-    Args:
-        metadata: 原始 metadata 字典
-        
-    Returns:
-        清理后的 metadata 字典
-    """
-    cleaned = {}
-    for key, value in metadata.items():
-        if isinstance(value, (dict, list)):
-            # 将嵌套字典或列表转换为 JSON 字符串
-            cleaned[key] = json.dumps(value, ensure_ascii=False)
-        else:
-            # 基本类型直接保留
-            cleaned[key] = value
-    return cleaned
-
 def initialize_knowledge_base(persist_directory: str = "data/vector_db") -> VectorDatabase:
     """
     初始化知识库
@@ -414,74 +392,20 @@ def initialize_knowledge_base(persist_directory: str = "data/vector_db") -> Vect
     """
     db = VectorDatabase(persist_directory=persist_directory)
     
-    # 如果数据库为空，则初始化所有数据
-    if db.get_collection_count() == 0:
-        documents = [item["document"] for item in LATEX_TEMPLATE_KNOWLEDGE]
-        metadatas = [_clean_metadata(item["metadata"]) for item in LATEX_TEMPLATE_KNOWLEDGE]
-        ids = [f"template_{item['journal'].lower().replace(' ', '_')}" for item in LATEX_TEMPLATE_KNOWLEDGE]
-        
-        db.add_documents(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
-        print(f"知识库已初始化，共添加 {len(documents)} 个模板")
+    # 按内容哈希同步：空库时全部写入，否则只写入缺失或有变化的模板
+    result = sync_templates(db.collection, LATEX_TEMPLATE_KNOWLEDGE)
+    if result.changed:
+        if result.added:
+            print(f"知识库已更新，新增 {len(result.added)} 个模板: {', '.join(result.added)}")
+        if result.updated:
+            print(f"知识库已更新，更新 {len(result.updated)} 个模板: {', '.join(result.updated)}")
+        if result.removed:
+            print(f"知识库已更新，删除 {len(result.removed)} 个旧 ID 条目: {', '.join(result.removed)}")
+        print(f"知识库当前包含 {db.get_collection_count()} 个文档")
+        # 知识库内容已变化，丢弃缓存的搜索结果
+        clear_search_cache()
     else:
-        # 检查并添加缺失的模板，或更新已存在的模板
-        existing_count = db.get_collection_count()
-        new_templates = []
-        updated_templates = []
-        new_documents = []
-        new_metadatas = []
-        new_ids = []
-        
-        # 首先检查并删除旧的 "BIThesis" 条目（如果存在）
-        old_bithesis_id = "template_bithesis"
-        if db.id_exists(old_bithesis_id):
-            try:
-                db.delete_documents(ids=[old_bithesis_id])
-                print(f"已删除旧的 BIThesis 条目")
-            except Exception as e:
-                print(f"删除旧 BIThesis 条目时出错: {e}")
-        
-        for item in LATEX_TEMPLATE_KNOWLEDGE:
-            template_id = f"template_{item['journal'].lower().replace(' ', '_')}"
-            if not db.id_exists(template_id):
-                # 新模板
-                new_templates.append(item['journal'])
-                new_documents.append(item["document"])
-                new_metadatas.append(_clean_metadata(item["metadata"]))
-                new_ids.append(template_id)
-            elif item['journal'] in ['BIThesis-Graduate', 'BIThesis-Undergraduate', 'BIThesis-Undergraduate-English']:
-                # BIThesis 模板需要更新（删除旧的后添加新的）
-                try:
-                    db.delete_documents(ids=[template_id])
-                    updated_templates.append(item['journal'])
-                    new_documents.append(item["document"])
-                    new_metadatas.append(_clean_metadata(item["metadata"]))
-                    new_ids.append(template_id)
-                except Exception as e:
-                    # 如果删除失败（可能不存在），仍然尝试添加
-                    print(f"更新 {item['journal']} 时删除旧条目失败（可能不存在）: {e}")
-                    updated_templates.append(item['journal'])
-                    new_documents.append(item["document"])
-                    new_metadatas.append(_clean_metadata(item["metadata"]))
-                    new_ids.append(template_id)
-        
-        if new_templates or updated_templates:
-            if new_documents:
-                db.add_documents(
-                    documents=new_documents,
-                    metadatas=new_metadatas,
-                    ids=new_ids
-                )
-            if new_templates:
-                print(f"知识库已更新，新增 {len(new_templates)} 个模板: {', '.join(new_templates)}")
-            if updated_templates:
-                print(f"知识库已更新，更新 {len(updated_templates)} 个模板: {', '.join(updated_templates)}")
-            print(f"知识库当前包含 {db.get_collection_count()} 个文档")
-        else:
-            print(f"知识库已存在，当前包含 {db.get_collection_count()} 个文档，所有模板已是最新")
+        print(f"知识库已存在，当前包含 {db.get_collection_count()} 个文档，所有模板已是最新")
     
     return db
 
@@ -497,10 +421,23 @@ def get_all_journal_names() -> List[str]:
     sorted_names = sorted(journal_names, key=lambda x: (not x.isascii(), x))
     return sorted_names
 
+# 搜索结果缓存时间（秒）：其他进程（update_knowledge_base.py 等）修改知识库后，
+# 最多经过这段时间即可在当前进程中生效
+_SEARCH_CACHE_TTL = 60
+_SEARCH_CACHE_MAXSIZE = 256
+_search_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+def clear_search_cache() -> None:
+    """清空 knowledge_base_search 的结果缓存"""
+    _search_cache.clear()
+
 def knowledge_base_search(journal_name: str, n_results: int = 3) -> str:
     """
     在知识库中搜索期刊模板信息
     
+    结果按 (journal_name, n_results) 缓存 _SEARCH_CACHE_TTL 秒；
+    initialize_knowledge_base 写入或删除条目时会立即清空缓存。
+    
     Args:
         journal_name: 期刊名称
         n_results: 返回结果数量
@@ -508,6 +445,18 @@ def knowledge_base_search(journal_name: str, n_results: int = 3) -> str:
     Returns:
         格式化的搜索结果字符串
     """
+    key = (journal_name, n_results)
+    cached = _search_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    result = _search_knowledge_base(journal_name, n_results)
+    if len(_search_cache) >= _SEARCH_CACHE_MAXSIZE:
+        _search_cache.clear()
+    _search_cache[key] = (time.monotonic() + _SEARCH_CACHE_TTL, result)
+    return result
+
+def _search_knowledge_base(journal_name: str, n_results: int) -> str:
+    """执行一次不经缓存的知识库搜索，参数与返回值同 knowledge_base_search"""
     # 初始化或加载知识库
     db = initialize_knowledge_base()
     
@@ -524,12 +473,12 @@ def knowledge_base_search(journal_name: str, n_results: int = 3) -> str:
                     # 找到精确匹配，获取完整信息
                     doc_id = all_results['ids'][i]
                     doc_text = all_results['documents'][i] if all_results.get('documents') else ""
-                    exact_match = {
-                        'document': doc_text,
-                        'metadata': metadata,
-                        'distance': 0.0,
-                        'id': doc_id
-                    }
+                    exact_match = SearchHit(
+                        document=doc_text,
+                        metadata=metadata,
+                        distance=0.0,
+                        id=doc_id
+                    )
                     break
     except Exception as e:
         print(f"精确匹配检查时出错: {e}")
@@ -541,7 +490,7 @@ def knowledge_base_search(journal_name: str, n_results: int = 3) -> str:
     if exact_match:
         # 移除向量搜索结果中的精确匹配（如果存在）
         filtered_results = [r for r in vector_results 
-                          if r.get('metadata', {}).get('journal_name', '').lower() != query_lower]
+                          if r.metadata.get('journal_name', '').lower() != query_lower]
         results = [exact_match] + filtered_results[:n_results - 1]
     else:
         results = vector_results[:n_results]
@@ -552,13 +501,13 @@ def knowledge_base_search(journal_name: str, n_results: int = 3) -> str:
     # 格式化返回结果
     output_parts = []
     for i, result in enumerate(results, 1):
-        doc = result['document']
-        metadata = result.get('metadata', {})
-        distance = result.get('distance', 0)
+        doc = result.document
+        metadata = result.metadata
+        distance = result.distance
         similarity = 1 - distance if distance else 1.0  # 转换为相似度分数
         
         # 如果是精确匹配，标注出来
-        match_type = "（精确匹配）" if i == 1 and exact_match and result == exact_match else ""
+        match_type = "（精确匹配）" if i == 1 and exact_match and result is exact_match else ""
         
         output_parts.append(f"【结果 {i}】相似度: {similarity:.2%}{match_type}")
         output_parts.append(f"期刊: {metadata.get('journal_name', 'Unknown')}")
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 from jsonschema import ValidationError, validate
@@ -7,8 +8,9 @@ from jsonschema import ValidationError, validate
 SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "../config/document_schema.json")
 
 
+@lru_cache(maxsize=1)
 def load_document_schema(schema_path: str = SCHEMA_PATH) -> Dict[str, Any]:
-    """从文件系统加载文档Schema。"""
+    """从文件系统加载文档Schema（结果会被缓存，调用方不要修改返回的字典）。"""
     with open(schema_path, "r", encoding="utf-8") as schema_file:
         return json.load(schema_file)
 
@@ -5,9 +5,20 @@
 import os
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass, field
+from typing import List, Dict, Optional, Union
 import json
 
+
+@dataclass(slots=True)
+class SearchHit:
+    """单条检索结果"""
+    document: str
+    metadata: Dict = field(default_factory=dict)
+    distance: Optional[float] = None
+    id: Optional[str] = None
+
+
 class VectorDatabase:
     """向量数据库管理类"""
     
@@ -56,16 +67,17 @@ class VectorDatabase:
             ids=ids
         )
     
-    def search(self, query: str, n_results: int = 3) -> List[Dict]:
+    def search(self, query: str, n_results: int = 3, as_dict: bool = False) -> Union[List[SearchHit], List[Dict]]:
         """
         搜索相似文档
         
         Args:
             query: 查询文本
             n_results: 返回结果数量
+            as_dict: 为 True 时返回旧版的字典列表
             
         Returns:
-            搜索结果列表，每个结果包含文档内容、元数据和相似度分数
+            搜索结果列表（SearchHit），每个结果包含文档内容、元数据和相似度分数
         """
         results = self.collection.query(
             query_texts=[query],
@@ -75,13 +87,20 @@ class VectorDatabase:
         # 格式化返回结果
         formatted_results = []
         if results['documents'] and len(results['documents'][0]) > 0:
-            for i in range(len(results['documents'][0])):
-                formatted_results.append({
-                    'document': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
-                    'distance': results['distances'][0][i] if results['distances'] else None
-                })
+            documents = results['documents'][0]
+            metadatas = results['metadatas'][0] if results.get('metadatas') else None
+            distances = results['distances'][0] if results.get('distances') else None
+            ids = results['ids'][0] if results.get('ids') else None
+            for i, document in enumerate(documents):
+                formatted_results.append(SearchHit(
+                    document=document,
+                    metadata=(metadatas[i] if metadatas else None) or {},
+                    distance=distances[i] if distances else None,
+                    id=ids[i] if ids else None
+                ))
         
+        if as_dict:
+            return [asdict(hit) for hit in formatted_results]
         return formatted_results
     
     def get_collection_count(self) -> int:
@@ -89,14 +108,14 @@ class VectorDatabase:
         return self.collection.count()
     
     def get_all_ids(self) -> List[str]:
-        """获取集合中所有文档的ID列表"""
-        results = self.collection.get()
+        """获取集合中所有文档的ID列表（include=[] 只返回 ids）"""
+        results = self.collection.get(include=[])
         return results.get('ids', []) if results else []
     
     def id_exists(self, doc_id: str) -> bool:
         """检查指定的文档ID是否已存在"""
         try:
-            results = self.collection.get(ids=[doc_id])
+            results = self.collection.get(ids=[doc_id], include=[])
             return len(results.get('ids', [])) > 0
         except Exception:
             return False
@@ -1,573 +1,39 @@
-import gradio as gr
+import asyncio
+import hashlib
 import os
-import sys
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-import requests
+from typing import TYPE_CHECKING, Optional
+import httpx
 
-# 添加项目根目录到路径，以便支持直接运行和模块导入
-# 计算项目根目录（src/ 的父目录）
-current_file = Path(__file__).resolve()
-# web_ui.py 位于: src/autolatex/web_ui.py
-# 向上2级到达 src/，再向上1级到达项目根目录
-src_dir = current_file.parent.parent  # src/
-project_root = src_dir.parent  # 项目根目录
+# gradio 导入耗时较长，只在真正构建界面/返回组件更新时才导入，
+# 这样仅使用 get_available_templates 等辅助函数时不必加载 gradio
+if TYPE_CHECKING:
+    import gradio as gr
 
-# 添加 src 目录到路径（用于绝对导入 autolatex.*）
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+    _json_loads = json.loads
 
 # 导入模板工具
 from autolatex.tools.template_manager import list_available_journals
 from autolatex.tools.template_tools import TemplateRetrievalTool
 
-# 自定义 CSS 样式
-custom_css = """
-/* 整体布局 */
-.gradio-container {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'PingFang SC', 'Hiragino Sans GB', 'Microsoft YaHei', sans-serif;
-    max-width: 100% !important;
-}
-
-/* 主容器 */
-.main-container {
-    display: flex;
-    height: 100vh;
-    overflow: hidden;
-}
-
-/* 左侧边栏 */
-.sidebar {
-    width: 250px !important;
-    background: #ffffff;
-    border-right: 1px solid #e5e5e5;
-    display: flex;
-    flex-direction: column;
-    height: 100vh;
-    position: fixed !important;
-    left: 0 !important;
-    top: 0 !important;
-    z-index: 1000;
-    overflow-y: auto;
-    transition: left 0.3s ease, display 0.3s ease;
-}
-
-.sidebar-header {
-    padding: 20px;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    border-bottom: 1px solid #e5e5e5;
-}
-
-.logo-container {
-    display: flex;
-    align-items: center;
-    gap: 10px;
-}
-
-.logo-icon {
-    width: 40px;
-    height: 40px;
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
-    border-radius: 8px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    color: white;
-    font-weight: bold;
-    font-size: 20px;
-}
-
-.logo-text {
-    font-size: 18px;
-    font-weight: 600;
-    color: #1f2937;
-}
-
-.collapse-icon {
-    color: #9ca3af;
-    cursor: pointer;
-    font-size: 18px;
-    user-select: none;
-    transition: color 0.2s;
-}
-
-.collapse-icon:hover {
-    color: #6b7280;
-}
-
-/* 导航菜单 */
-.nav-menu {
-    flex: 1;
-    padding: 10px 0;
-    overflow-y: auto;
-}
-
-.nav-item {
-    padding: 12px 20px;
-    display: flex;
-    align-items: center;
-    gap: 12px;
-    cursor: pointer;
-    transition: background 0.2s;
-    position: relative;
-}
-
-.nav-item:hover {
-    background: #f9fafb;
-}
-
-.nav-item.active {
-    background: #f0f0ff;
-    border-left: 3px solid #8b5cf6;
-}
-
-.nav-item-icon {
-    font-size: 20px;
-    width: 24px;
-    text-align: center;
-}
-
-.nav-item-content {
-    flex: 1;
-}
-
-.nav-item-title {
-    font-size: 14px;
-    font-weight: 500;
-    color: #1f2937;
-    margin-bottom: 2px;
-}
-
-.nav-item-desc {
-    font-size: 12px;
-    color: #6b7280;
-}
-
-.nav-item-arrow {
-    color: #9ca3af;
-    font-size: 14px;
-}
-
-/* 底部链接 */
-.sidebar-footer {
-    padding: 20px;
-    border-top: 1px solid #e5e5e5;
-}
-
-.footer-item {
-    padding: 10px 0;
-    display: flex;
-    align-items: center;
-    gap: 10px;
-    color: #1f2937;
-    font-size: 14px;
-    cursor: pointer;
-}
-
-.footer-item:hover {
-    color: #8b5cf6;
-}
-
-/* 主内容区 */
-.main-content {
-    margin-left: 250px;
-    flex: 1;
-    background: #f5f5f5;
-    min-height: 100vh;
-    position: relative;
-    padding: 30px 40px;
-    width: calc(100% - 250px);
-    transition: margin-left 0.3s ease, width 0.3s ease;
-}
-
-/* 点状网格背景 */
-.main-content::before {
-    content: '';
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background-image: radial-gradient(circle, #d1d5db 1px, transparent 1px);
-    background-size: 20px 20px;
-    opacity: 0.3;
-    pointer-events: none;
-}
-
-.content-wrapper {
-    position: relative;
-    z-index: 1;
-    max-width: 1200px;
-    width: 100%;
-    margin: 0 auto;
-}
-
-/* 横幅 */
-.banner {
-    background: linear-gradient(135deg, #ffc107 0%, #ffb300 100%);
-    border-radius: 12px;
-    padding: 15px 20px;
-    margin-bottom: 30px;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-}
-
-.banner-text {
-    color: #1f2937;
-    font-size: 14px;
-    font-weight: 500;
-    display: flex;
-    align-items: center;
-    gap: 8px;
-}
-
-.banner-close {
-    color: #1f2937;
-    cursor: pointer;
-    font-size: 20px;
-    font-weight: bold;
-    width: 24px;
-    height: 24px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    border-radius: 50%;
-    transition: background 0.2s;
-}
-
-.banner-close:hover {
-    background: rgba(0,0,0,0.1);
-}
-
-/* 标题区域 */
-.title-section {
-    text-align: center;
-    margin-bottom: 20px;
-}
-
-.main-title {
-    font-size: 36px;
-    font-weight: 700;
-    color: #1f2937;
-    margin-bottom: 12px;
-}
-
-.subtitle {
-    font-size: 16px;
-    color: #6b7280;
-}
-
-/* 上传卡片 */
-.upload-card {
-    background: #ffffff;
-    border-radius: 16px;
-    padding: 45px;
-    box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-}
-
-.pdf-icon-container {
-    text-align: center;
-    margin-bottom: 10px;
-}
-
-.pdf-icon {
-    width: 60px;
-    height: 60px;
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
-    border-radius: 10px;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    color: white;
-    font-size: 40px;
-    font-weight: bold;
-    box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3);
-}
-
-.upload-button {
-    width: auto !important;
-    min-width: 280px;
-    padding: 12px 24px !important;
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%) !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 12px !important;
-    font-size: 16px !important;
-    font-weight: 600 !important;
-    cursor: pointer;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    gap: 8px;
-    margin: 0 auto 12px auto;
-    transition: transform 0.2s, box-shadow 0.2s;
-}
-
-.upload-button:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 6px 20px rgba(139, 92, 246, 0.4);
-}
-
-.file-info {
-    text-align: center;
-    color: #6b7280;
-    font-size: 13px;
-    line-height: 1.6;
-    margin-bottom: 10px;
-}
-
-.model-section {
-    display: flex;
-    align-items: center;
-    gap: 15px;
-    margin-top: 10px;
-    padding-top: 10px;
-    border-top: 1px solid #e5e5e5;
-}
-
-.model-label {
-    font-size: 14px;
-    color: #1f2937;
-    font-weight: 500;
-    white-space: nowrap;
-}
-
-.model-dropdown {
-    flex: 1;
-}
-
-.translate-button {
-    padding: 10px 20px;
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
-    color: white;
-    border: none;
-    border-radius: 8px;
-    font-size: 14px;
-    font-weight: 500;
-    cursor: pointer;
-    display: flex;
-    align-items: center;
-    gap: 6px;
-    white-space: nowrap;
-    transition: transform 0.2s, box-shadow 0.2s;
-}
-
-.translate-button:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3);
-}
-
-/* 隐藏 Gradio 默认样式 */
-.hide-gradio-default {
-    display: none !important;
-}
-
-/* 隐藏 Gradio 页脚链接 */
-footer {
-    display: none !important;
-}
-
-.gradio-footer {
-    display: none !important;
-}
-
-a[href*="api"], a[href*="gradio"], a[href*="settings"] {
-    display: none !important;
-}
-
-/* 使用 JavaScript 隐藏包含特定文本的元素 */
-
-/* 调整 Gradio 组件样式 */
-.gradio-container .main {
-    padding: 0 !important;
-}
-
-/* 文件上传组件样式调整 */
-input[type="file"] {
-    display: none;
-}
-
-/* 下拉框样式 */
-select, .gradio-dropdown {
-    padding: 10px 12px;
-    border: 1px solid #e5e5e5;
-    border-radius: 8px;
-    background: #ffffff;
-    font-size: 14px;
-    color: #1f2937;
-}
-
-/* 确保侧边栏在最上层 */
-.sidebar {
-    z-index: 1000;
-}
-
-/* 调整主内容区域以适应侧边栏 */
-#root > div > div {
-    margin-left: 250px;
-}
-
-/* 覆盖 Gradio 默认主题 */
-.dark {
-    --background-fill-primary: #f5f5f5;
-}
-
-/* 确保 body 和 html 没有默认边距 */
-body, html {
-    margin: 0;
-    padding: 0;
-    overflow-x: hidden;
-}
-
-/* 调整 Gradio Blocks 容器 */
-.gradio-container {
-    padding: 0 !important;
-    max-width: 100% !important;
-}
-
-/* 主内容区域样式增强 */
-.main-content {
-    padding: 30px 40px;
-}
-
-.sidebar-collapsed .main-content {
-    margin-left: 0 !important;
-    width: 100% !important;
-}
-
-.sidebar-collapsed #root > div > div {
-    margin-left: 0 !important;
-}
-
-/* 按钮样式覆盖 */
-button.upload-button {
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%) !important;
-    border: none !important;
-    color: white !important;
-}
-
-button.translate-button {
-    background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%) !important;
-    border: none !important;
-    color: white !important;
-}
-
-button.delete-button {
-    background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%) !important;
-    border: none !important;
-    color: white !important;
-    padding: 10px 20px !important;
-    border-radius: 8px !important;
-    font-size: 14px !important;
-    font-weight: 500 !important;
-    cursor: pointer;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    gap: 6px;
-    white-space: nowrap;
-    transition: transform 0.2s, box-shadow 0.2s;
-    margin-top: 1px;
-}
-
-button.delete-button:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 4px 12px rgba(239, 68, 68, 0.4);
-}
-
-.delete-button-container {
-    text-align: center;
-    margin-top: 8px;
-}
-
-/* 删除按钮行样式 - 减少间距 */
-.delete-button-row {
-    margin-top: 0 !important;
-    padding-top: 0 !important;
-}
-
-.delete-button-row > div {
-    margin-top: 0 !important;
-    padding-top: 0 !important;
-}
-
-/* 展开侧边栏按钮（当侧边栏隐藏时显示） */
-.expand-sidebar-btn {
-    position: fixed;
-    left: 0;
-    top: 20px;
-    width: 30px;
-    height: 40px;
-    background: #ffffff;
-    border: 1px solid #e5e5e5;
-    border-left: none;
-    border-radius: 0 8px 8px 0;
-    display: none;
-    align-items: center;
-    justify-content: center;
-    cursor: pointer;
-    z-index: 999;
-    color: #6b7280;
-    font-size: 16px;
-    box-shadow: 2px 0 4px rgba(0,0,0,0.1);
-    transition: all 0.2s;
-}
-
-.expand-sidebar-btn:hover {
-    background: #f9fafb;
-    color: #8b5cf6;
-}
-
-/* 处理结果输出框可拖拽缩放样式 */
-.resizable-output {
-    position: relative;
-}
-
-.resizable-output textarea {
-    resize: both;
-    min-height: 42px;  /* 约等于单行高度，便于收缩到最小 */
-    max-height: 70vh;
-    min-width: 320px;
-    padding: 14px 16px;
-    border: 1px solid #e5e7eb;
-    border-radius: 12px;
-    background: #ffffff;
-    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-    font-family: "Fira Code", "SFMono-Regular", Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
-    line-height: 1.5;
-}
-
-.resizable-output textarea:focus {
-    outline: none;
-    border-color: #8b5cf6;
-    box-shadow: 0 6px 20px rgba(139, 92, 246, 0.25);
-}
-
-/* 下载链接样式 */
-.download-link {
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    padding: 10px 14px;
-    background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%);
-    color: #ffffff;
-    border-radius: 10px;
-    text-decoration: none;
-    font-weight: 600;
-    box-shadow: 0 4px 12px rgba(34, 197, 94, 0.3);
-    transition: transform 0.15s ease, box-shadow 0.15s ease, opacity 0.2s;
-}
-
-.download-link:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 6px 18px rgba(34, 197, 94, 0.35);
-    opacity: 0.95;
-}
-"""
+# 共享的异步 HTTP 客户端（连接池 + keep-alive），处理函数为 async，等待后端时不占用 Gradio 工作线程
+_ACLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    transport=httpx.AsyncHTTPTransport(retries=3),
+    # 显式请求压缩响应（br 需要额外安装 brotli，这里只声明 httpx 内置支持的编码）
+    headers={"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"},
+)
 
 # HTML 模板
 sidebar_html = """
@@ -577,7 +43,7 @@ sidebar_html = """
             <div class="logo-icon">AT</div>
             <div class="logo-text">AutoTex</div>
         </div>
-        <div class="collapse-icon" id="sidebar-toggle" onclick="window.toggleSidebar()">←</div>
+        <div class="collapse-icon" id="sidebar-toggle">←</div>
     </div>
     <div class="nav-menu">
         <div class="nav-item active">
@@ -625,16 +91,89 @@ title_html = """
 </div>
 """
 
+pdf_icon_html = """
+<div class="pdf-icon-container">
+    <div class="pdf-icon">📄</div>
+</div>
+"""
+
+file_info_html = """
+<div class="file-info">
+    <div>支持文件类型: Word (.doc, .docx) | Markdown (.md, .markdown) | 文本 (.txt)</div>
+    <div>最大文件大小: 50MB</div>
+</div>
+"""
+
+spacer_html = '<div style="flex: 1;"></div>'
+
+model_label_html = '<div class="model-label">期刊类型</div>'
+
+# 允许上传的最大文件大小（与页面提示保持一致）
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+
+# 无法读取模板目录时使用的默认模板列表
+_FALLBACK_TEMPLATES = ("IEEE Transactions", "ACM Conference", "Springer LNCS", "Elsevier Article", "Nature", "Science", "自定义模板")
+
+# 模板列表缓存（TTL 内重复构建界面时直接返回，不再扫描模板目录）
+_TEMPLATES_CACHE_TTL = 300
+_templates_cache = {"value": None, "expires": 0.0}
+
 def get_available_templates():
-    """获取所有可用的模板列表"""
+    """获取所有可用的模板列表（结果缓存 _TEMPLATES_CACHE_TTL 秒）"""
+    if _templates_cache["value"] is not None and time.monotonic() < _templates_cache["expires"]:
+        return _templates_cache["value"]
     try:
         templates = list_available_journals()
-        if templates:
-            return templates
-        return ["IEEE Transactions", "ACM Conference", "Springer LNCS", "Elsevier Article", "Nature", "Science", "自定义模板"]
+        if not templates:
+            templates = list(_FALLBACK_TEMPLATES)
     except Exception as e:
-        # 如果获取失败，返回默认列表
-        return ["IEEE Transactions", "ACM Conference", "Springer LNCS", "Elsevier Article", "Nature", "Science", "自定义模板"]
+        # 如果获取失败，返回默认列表（不缓存，下次重新尝试）
+        return list(_FALLBACK_TEMPLATES)
+    _templates_cache.update(value=templates, expires=time.monotonic() + _TEMPLATES_CACHE_TTL)
+    return templates
+
+def refresh_templates():
+    """清空模板列表和模板预览缓存并重新扫描模板目录（新增或修改模板后使用）"""
+    global _templates_future
+    _templates_cache.update(value=None, expires=0.0)
+    _templates_future = None
+    _load_template_preview.cache_clear()
+    return get_available_templates()
+
+# 在后台线程预取模板列表，构建界面时不必等待目录扫描。
+# 由 create_app 启动时触发，仅导入本模块不会扫描模板目录
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autotex-prefetch")
+_templates_future = None
+
+def start_template_prefetch():
+    """开始在后台预取模板列表（已开始时直接返回已有的 Future）"""
+    global _templates_future
+    if _templates_future is None:
+        _templates_future = _PREFETCH_EXECUTOR.submit(get_available_templates)
+    return _templates_future
+
+def get_initial_templates(timeout: float = 0.5):
+    """构建界面时获取模板列表：最多等待 timeout 秒，未就绪时先返回默认列表（页面加载后再填充）"""
+    try:
+        return start_template_prefetch().result(timeout=timeout)
+    except FutureTimeoutError:
+        return list(_FALLBACK_TEMPLATES)
+
+@lru_cache(maxsize=1)
+def get_template_tool() -> TemplateRetrievalTool:
+    """模板检索工具单例：首次使用时创建，之后在各次预览之间复用（创建失败不影响模块导入）"""
+    return TemplateRetrievalTool()
+
+@lru_cache(maxsize=32)
+def _load_template_preview(template_name: str) -> str:
+    """读取模板并生成（截断后的）预览文本，按模板名缓存"""
+    template_content = get_template_tool()._run(template_name)
+    
+    # 如果内容太长，只显示前5000个字符
+    content_length = len(template_content)
+    if content_length > 5000:
+        return f"{template_content[:5000]}\n\n... (内容已截断，共 {content_length} 个字符)"
+    return template_content
 
 def preview_template(template_name: str) -> str:
     """预览模板内容"""
@@ -642,390 +181,190 @@ def preview_template(template_name: str) -> str:
         return "请选择一个模板名称进行预览"
     
     try:
-        tool = TemplateRetrievalTool()
-        template_content = tool._run(template_name)
-        
-        # 如果内容太长，只显示前5000个字符
-        if len(template_content) > 5000:
-            return f"{template_content[:5000]}\n\n... (内容已截断，共 {len(template_content)} 个字符)"
-        return template_content
+        return _load_template_preview(template_name)
     except Exception as e:
         return f"预览模板失败: {str(e)}"
 
-def process_file(file, journal_type):
-    """处理上传的文件并生成LaTeX（通过后端 REST API 上传 + 转换）"""
+async def preview_template_async(template_name: str) -> str:
+    """预览模板内容（异步版本：在线程中读取模板文件，不阻塞事件循环）"""
+    return await asyncio.to_thread(preview_template, template_name)
+
+# 错误响应体最多读取的字节数
+_ERROR_BODY_LIMIT = 2048
+
+def _get_api_base() -> str:
+    """后端 REST API 地址（可通过环境变量 AUTOLATEX_API_BASE 覆盖）"""
+    return os.environ.get("AUTOLATEX_API_BASE", "http://127.0.0.1:8000")
+
+async def _read_error_body(resp, limit: int = _ERROR_BODY_LIMIT) -> str:
+    """只读取错误响应体的前 limit 个字节（错误页可能很大，只需要用于提示），优先返回其中的 detail 字段"""
+    chunks = []
+    size = 0
+    async for chunk in resp.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    body = b"".join(chunks)[:limit]
+    if size <= limit:
+        # FastAPI 的 HTTPException 返回 {"detail": ...}，直接展示 detail
+        try:
+            detail = _json_loads(body).get("detail")
+            if detail:
+                return str(detail)
+        except Exception:
+            pass
+    text = body.decode("utf-8", "replace")
+    return text + " ..." if size > limit else text
+
+async def _api_call(method: str, path: str, **kwargs):
+    """
+    调用后端 REST API
+    
+    连接重试由 _ACLIENT 的 transport 统一处理。
+    
+    Returns:
+        (是否成功, 解析后的 JSON 或错误信息字符串)
+    """
+    api_base = _get_api_base()
+    try:
+        async with _ACLIENT.stream(method, f"{api_base}{path}", **kwargs) as resp:
+            if resp.status_code != 200:
+                error_text = await _read_error_body(resp)
+                print(f"[Web UI] {path} HTTP {resp.status_code}: {error_text}")
+                return False, f"❌ 调用 {path} 失败，HTTP {resp.status_code}: {error_text}"
+            body = await resp.aread()
+        return True, _json_loads(body)
+    except httpx.ConnectError:
+        print(f"[Web UI] 无法连接后端: {api_base}")
+        return False, f"❌ 无法连接到后端服务，请确认 API 已启动: {api_base}"
+    except httpx.TimeoutException:
+        print(f"[Web UI] {path} 请求超时")
+        return False, "❌ 请求超时，请稍后重试"
+    except Exception as e:
+        print(f"[Web UI] 调用 {path} 异常: {e}")
+        return False, f"❌ 发生错误: {str(e)}"
+
+def build_download_link(pdf_url, pdf_name=None):
+    """生成下载链接的 HTML 更新对象"""
+    import gradio as gr
+
+    if not pdf_url:
+        return gr.update(visible=False, value=None)
+    full_url = pdf_url if str(pdf_url).startswith("http") else f"{_get_api_base().rstrip('/')}{pdf_url}"
+    display_name = pdf_name or "生成结果.pdf"
+    html = (
+        f'<a class="download-link" href="{full_url}" target="_blank" '
+        f'download="{display_name}">⬇️ 下载PDF（{display_name}）</a>'
+    )
+    return gr.update(value=html, visible=True)
+
+async def process_file(file, journal_type):
+    """处理上传的文件并生成LaTeX（通过后端 REST API 一次性上传 + 转换）"""
+    import gradio as gr
+
     print("[Web UI] process_file 被调用")  # 调试日志
     if file is None:
         print("[Web UI] 未选择文件")
         return "请先上传论文文件", gr.update(visible=False, value=None)
 
-    # 1. 调用后端 /api/v1/paper/upload 接口上传文件
-    api_base = os.environ.get("AUTOLATEX_API_BASE", "http://127.0.0.1:8000")
-    upload_url = f"{api_base}/api/v1/paper/upload"
-    convert_url = f"{api_base}/api/v1/paper/convert"
-
-    def build_download_link(pdf_url, pdf_name=None):
-        """生成下载链接的 HTML 更新对象"""
-        if not pdf_url:
-            return gr.update(visible=False, value=None)
-        full_url = pdf_url if str(pdf_url).startswith("http") else f"{api_base.rstrip('/')}{pdf_url}"
-        display_name = pdf_name or "生成结果.pdf"
-        html = (
-            f'<a class="download-link" href="{full_url}" target="_blank" '
-            f'download="{display_name}">⬇️ 下载PDF（{display_name}）</a>'
-        )
-        return gr.update(value=html, visible=True)
+    # Gradio `file` 为临时文件路径（type="filepath"），部分版本为带 .name 属性的对象
+    # 尝试获取原始文件名（部分 Gradio 版本会带有 orig_name）
+    temp_path = getattr(file, "name", file)
+    orig_name = getattr(file, "orig_name", None) or os.path.basename(temp_path)
 
+    # 上传前先检查文件大小，避免超大文件在上传阶段超时
     try:
-        # Gradio `file` 为一个带临时路径的对象，file.name 为临时文件路径
-        # 尝试获取原始文件名（部分 Gradio 版本会带有 orig_name）
-        orig_name = getattr(file, "orig_name", None) or os.path.basename(file.name)
-
-        print(f"[Web UI] 准备上传文件: {orig_name}, 临时路径: {file.name}")
-        with open(file.name, "rb") as f:
-            files = {"file": (orig_name, f, "application/octet-stream")}
-            resp = requests.post(upload_url, files=files, timeout=60)
-
-        if resp.status_code != 200:
-            print(f"[Web UI] 上传接口 HTTP {resp.status_code}: {resp.text}")
-            return f"❌ 调用上传接口失败，HTTP {resp.status_code}: {resp.text}", gr.update(visible=False, value=None)
-
-        data = resp.json()
-        print(f"[Web UI] 上传接口返回: {data}")
-        if not data.get("success"):
-            return f"❌ 上传接口返回失败: {data.get('message') or data}", gr.update(visible=False, value=None)
+        file_size = os.path.getsize(temp_path)
+    except OSError as e:
+        return f"❌ 读取上传文件失败: {str(e)}", gr.update(visible=False, value=None)
+    if file_size > MAX_UPLOAD_SIZE:
+        return (
+            f"⚠️ 文件过大（{file_size / 1024 / 1024:.1f}MB），最大支持 {MAX_UPLOAD_SIZE // 1024 // 1024}MB",
+            gr.update(visible=False, value=None),
+        )
 
-        file_path = data.get("file_path")
-        filename = data.get("filename", orig_name)
-    except Exception as e:
-        print(f"[Web UI] 通过 REST API 上传文件失败: {e}")
-        return f"❌ 通过 REST API 上传文件失败: {str(e)}", gr.update(visible=False, value=None)
+    data = {
+        "journal_name": (journal_type or "").strip(),
+        "topic": "自动将word、txt、markdown格式论文转化为Latex格式论文",
+    }
+    print(f"[Web UI] 上传并转换文件: {orig_name}, 临时路径: {temp_path}, data={data}")
 
-    # 2. 调用 /api/v1/paper/convert 进行论文转换
+    # 调用后端 /api/v1/paper/upload_and_convert 接口，在一次请求中完成上传和转换
+    # httpx 按块从文件对象读取 multipart 请求体，不会把整个文件读入内存
     try:
-        payload = {
-            "file_path": file_path,
-            "journal_name": journal_type or "",
-            "topic": "自动将word、txt、markdown格式论文转化为Latex格式论文",
-        }
-        print(f"[Web UI] 调用转换接口, payload={payload}")
-        resp_conv = requests.post(convert_url, json=payload, timeout=600)
-        if resp_conv.status_code != 200:
-            print(f"[Web UI] 转换接口 HTTP {resp_conv.status_code}: {resp_conv.text}")
-            return (
-                "✅ 文件上传成功，但转换接口调用失败。\n"
-                f"文件名: {filename}\n"
-                f"后端保存路径: {file_path}\n\n"
-                f"调用 /api/v1/paper/convert 失败，HTTP {resp_conv.status_code}: {resp_conv.text}",
-                gr.update(visible=False, value=None),
-            )
-
-        conv_data = resp_conv.json()
-        print(f"[Web UI] 转换接口返回: {conv_data}")
-        if not conv_data.get("success"):
-            return (
-                "✅ 文件上传成功，但转换失败。\n"
-                f"文件名: {filename}\n"
-                f"后端保存路径: {file_path}\n\n"
-                f"转换消息: {conv_data.get('message')}\n"
-                f"错误信息: {conv_data.get('error')}",
-                gr.update(visible=False, value=None),
+        with open(temp_path, "rb") as f:
+            files = {"file": (orig_name, f, "application/octet-stream")}
+            ok, conv_data = await _api_call(
+                "POST", "/api/v1/paper/upload_and_convert", files=files, data=data, timeout=600
             )
+    except OSError as e:
+        return f"❌ 读取上传文件失败: {str(e)}", gr.update(visible=False, value=None)
 
-        output_path = conv_data.get("output_path")
-        message = conv_data.get("message", "论文转换成功")
-        pdf_url = conv_data.get("pdf_url")
-        pdf_name = conv_data.get("pdf_filename")
-        download_update = build_download_link(pdf_url, pdf_name)
+    if not ok:
+        return conv_data, gr.update(visible=False, value=None)
 
+    print(f"[Web UI] 上传转换接口返回: {conv_data}")
+    filename = conv_data.get("filename", orig_name)
+    file_path = conv_data.get("file_path")
+    if not conv_data.get("success"):
         return (
-            f"✅ 论文文件已通过 REST API 上传并转换成功。\n"
-            f"文件名: {filename}\n"
-            f"上传保存路径: {file_path}\n\n"
-            f"转换结果: {message}\n"
-            f"LaTeX 输出路径: {output_path}",
-            download_update,
-        )
-    except Exception as e:
-        print(f"[Web UI] 调用转换接口异常: {e}")
-        return (
-            "✅ 文件上传成功，但在调用转换接口时发生异常。\n"
+            "✅ 文件上传成功，但转换失败。\n"
             f"文件名: {filename}\n"
             f"后端保存路径: {file_path}\n\n"
-            f"异常信息: {str(e)}",
+            f"转换消息: {conv_data.get('message')}\n"
+            f"错误信息: {conv_data.get('error')}",
             gr.update(visible=False, value=None),
         )
 
-# JavaScript 代码用于布局调整
-sidebar_toggle_js = """
-<script>
-window.toggleSidebar = window.toggleSidebar || function() {
-    const sidebar = document.querySelector('.sidebar');
-    const mainContent = document.querySelector('.main-content');
-    let expandBtn = document.getElementById('expand-sidebar-btn');
-    const body = document.body;
+    return (
+        f"✅ 论文文件已通过 REST API 上传并转换成功。\n"
+        f"文件名: {filename}\n"
+        f"上传保存路径: {file_path}\n\n"
+        f"转换结果: {conv_data.get('message', '论文转换成功')}\n"
+        f"LaTeX 输出路径: {conv_data.get('output_path')}",
+        build_download_link(conv_data.get("pdf_url"), conv_data.get("pdf_filename")),
+    )
+
+# 静态资源（CSS/JS）以文件形式提供，浏览器可跨会话缓存，不再内嵌到每次页面响应中
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_URL_PREFIX = "/static"
+
+def _static_url(filename: str, url_prefix: Optional[str] = None) -> str:
+    """
+    静态文件 URL，附带内容哈希作为版本号（文件内容变化时 URL 随之变化，可放心长期缓存）
+
+    url_prefix 为 None 时使用 Gradio 自带的文件路由（需先 gr.set_static_paths），
+    适用于没有经过 create_app 挂载 /static、直接 launch() 界面的情况。
+    """
+    digest = hashlib.sha256((STATIC_DIR / filename).read_bytes()).hexdigest()[:8]
+    if url_prefix is None:
+        return f"/gradio_api/file={(STATIC_DIR / filename).as_posix()}?v={digest}"
+    return f"{url_prefix}/{filename}?v={digest}"
+
+def _static_head(url_prefix: Optional[str] = None) -> str:
+    """页面 <head> 中引用 CSS/JS 的标签"""
+    return (
+        f'<link rel="stylesheet" href="{_static_url("autotex.css", url_prefix)}">\n'
+        f'<script src="{_static_url("autotex.js", url_prefix)}"></script>'
+    )
+
+def create_interface(static_url_prefix: Optional[str] = None):
+    """
+    构建 Gradio 界面
+
+    Args:
+        static_url_prefix: CSS/JS 所在的 URL 前缀。create_app 传入其挂载的 /static；
+            默认 None 时通过 Gradio 的文件路由提供，直接 launch() 返回的界面也能加载样式和脚本。
+    """
+    import gradio as gr
+
+    if static_url_prefix is None:
+        gr.set_static_paths(paths=[STATIC_DIR])
 
-    if (!expandBtn) {
-        expandBtn = document.createElement('div');
-        expandBtn.id = 'expand-sidebar-btn';
-        expandBtn.className = 'expand-sidebar-btn';
-        expandBtn.textContent = '→';
-        expandBtn.onclick = function() { window.showSidebar(); };
-        expandBtn.style.display = 'none';
-        document.body.appendChild(expandBtn);
-    }
-
-    if (sidebar && mainContent) {
-        sidebar.style.display = 'none';
-        sidebar.style.left = '-250px';
-        mainContent.style.marginLeft = '0';
-        mainContent.style.width = '100%';
-        expandBtn.style.display = 'flex';
-        if (body) {
-            body.classList.add('sidebar-collapsed');
-        }
-    }
-};
-
-window.showSidebar = window.showSidebar || function() {
-    const sidebar = document.querySelector('.sidebar');
-    const mainContent = document.querySelector('.main-content');
-    const expandBtn = document.getElementById('expand-sidebar-btn');
-    const body = document.body;
-
-    if (sidebar && mainContent) {
-        sidebar.style.display = 'flex';
-        sidebar.style.left = '0';
-        mainContent.style.marginLeft = '250px';
-        mainContent.style.width = 'calc(100% - 250px)';
-        if (expandBtn) {
-            expandBtn.style.display = 'none';
-        }
-        if (body) {
-            body.classList.remove('sidebar-collapsed');
-        }
-    }
-};
-</script>
-"""
-
-
-layout_js = """
-<script>
-// 确保函数在全局作用域中定义
-window.toggleSidebar = function() {
-    const sidebar = document.querySelector('.sidebar');
-    const mainContent = document.querySelector('.main-content');
-    let expandBtn = document.getElementById('expand-sidebar-btn');
-    const body = document.body;
-    
-    if (!expandBtn) {
-        expandBtn = document.createElement('div');
-        expandBtn.id = 'expand-sidebar-btn';
-        expandBtn.className = 'expand-sidebar-btn';
-        expandBtn.textContent = '→';
-        expandBtn.onclick = function() { window.showSidebar(); };
-        expandBtn.style.display = 'none';
-        document.body.appendChild(expandBtn);
-    }
-    
-    if (sidebar && mainContent) {
-        sidebar.style.display = 'none';
-        sidebar.style.left = '-250px';
-        mainContent.style.marginLeft = '0';
-        mainContent.style.width = '100%';
-        expandBtn.style.display = 'flex';
-        if (body) {
-            body.classList.add('sidebar-collapsed');
-        }
-    }
-};
-
-window.showSidebar = function() {
-    const sidebar = document.querySelector('.sidebar');
-    const mainContent = document.querySelector('.main-content');
-    const expandBtn = document.getElementById('expand-sidebar-btn');
-    const body = document.body;
-    
-    if (sidebar && mainContent) {
-        sidebar.style.display = 'flex';
-        sidebar.style.left = '0';
-        mainContent.style.marginLeft = '250px';
-        mainContent.style.width = 'calc(100% - 250px)';
-        if (expandBtn) {
-            expandBtn.style.display = 'none';
-        }
-        if (body) {
-            body.classList.remove('sidebar-collapsed');
-        }
-    }
-};
-
-(function() {
-    // 等待 DOM 加载完成
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', initLayout);
-    } else {
-        initLayout();
-    }
-    
-    function initLayout() {
-        // 确保侧边栏固定在左侧
-        const sidebar = document.querySelector('.sidebar');
-        if (sidebar) {
-            sidebar.style.position = 'fixed';
-            sidebar.style.left = '0';
-            sidebar.style.top = '0';
-            sidebar.style.height = '100vh';
-            sidebar.style.zIndex = '1000';
-        }
-        
-        // 调整主内容区域的左边距
-        const mainContent = document.querySelector('.main-content');
-        if (mainContent) {
-            mainContent.style.marginLeft = '250px';
-        }
-        
-        // 调整 Gradio 容器
-        const gradioContainer = document.querySelector('.gradio-container');
-        if (gradioContainer) {
-            gradioContainer.style.maxWidth = '100%';
-            gradioContainer.style.padding = '0';
-        }
-        
-        // 隐藏 Gradio 页脚链接
-        const footer = document.querySelector('footer');
-        if (footer) {
-            footer.style.display = 'none';
-        }
-        
-        // 隐藏所有包含特定文本的链接
-        const allLinks = document.querySelectorAll('a');
-        allLinks.forEach(link => {
-            const text = link.textContent || link.innerText;
-            if (text.includes('APIを介して使用') || 
-                text.includes('Gradioで作成') || 
-                text.includes('設定') ||
-                link.href.includes('/api') ||
-                link.href.includes('/gradio') ||
-                link.href.includes('/settings')) {
-                link.style.display = 'none';
-                // 也隐藏父元素（如果是单独的链接容器）
-                if (link.parentElement && link.parentElement.tagName === 'SPAN') {
-                    link.parentElement.style.display = 'none';
-                }
-            }
-        });
-        
-        // 隐藏整个页脚容器
-        const footerContainers = document.querySelectorAll('footer, .gradio-footer');
-        footerContainers.forEach(container => {
-            container.style.display = 'none';
-        });
-        
-    }
-    
-    // 监听 Gradio 加载完成事件
-    window.addEventListener('load', initLayout);
-    
-    // 使用 MutationObserver 监听 DOM 变化
-    const observer = new MutationObserver(function(mutations) {
-        initLayout();
-        // 确保事件绑定
-        setupSidebarToggle();
-    });
-    
-    observer.observe(document.body, {
-        childList: true,
-        subtree: true
-    });
-    
-    // 单独的函数来设置侧边栏切换
-    function setupSidebarToggle() {
-        const sidebarToggle = document.getElementById('sidebar-toggle');
-        const sidebar = document.querySelector('.sidebar');
-        const mainContent = document.querySelector('.main-content');
-        
-        if (sidebarToggle && sidebar && mainContent && !sidebarToggle.dataset.listenerAttached) {
-            sidebarToggle.dataset.listenerAttached = 'true';
-            
-            // 创建展开按钮
-            let expandBtn = document.getElementById('expand-sidebar-btn');
-            if (!expandBtn) {
-                expandBtn = document.createElement('div');
-                expandBtn.id = 'expand-sidebar-btn';
-                expandBtn.className = 'expand-sidebar-btn';
-                expandBtn.textContent = '→';
-                expandBtn.style.display = 'none';
-                document.body.appendChild(expandBtn);
-            }
-            
-            function hideSidebar() {
-                if (sidebar && mainContent && expandBtn) {
-                    sidebar.style.display = 'none';
-                    sidebar.style.left = '-250px';
-                    mainContent.style.marginLeft = '0';
-                    mainContent.style.width = '100%';
-                    expandBtn.style.display = 'flex';
-                }
-            }
-            
-            function showSidebar() {
-                if (sidebar && mainContent && expandBtn) {
-                    sidebar.style.display = 'flex';
-                    sidebar.style.left = '0';
-                    mainContent.style.marginLeft = '250px';
-                    mainContent.style.width = 'calc(100% - 250px)';
-                    expandBtn.style.display = 'none';
-                }
-            }
-            
-            sidebarToggle.addEventListener('click', function(e) {
-                e.preventDefault();
-                e.stopPropagation();
-                console.log('Toggle clicked');
-                window.toggleSidebar();
-            });
-            
-            expandBtn.addEventListener('click', function(e) {
-                e.preventDefault();
-                e.stopPropagation();
-                window.showSidebar();
-            });
-        }
-    }
-    
-    // 使用事件委托作为备用方案
-    document.addEventListener('click', function(e) {
-        if (e.target && (e.target.id === 'sidebar-toggle' || e.target.classList.contains('collapse-icon'))) {
-            e.preventDefault();
-            e.stopPropagation();
-            window.toggleSidebar();
-        }
-        if (e.target && e.target.id === 'expand-sidebar-btn') {
-            e.preventDefault();
-            e.stopPropagation();
-            window.showSidebar();
-        }
-    });
-    
-    // 立即尝试设置
-    setupSidebarToggle();
-    
-    // 延迟设置，确保 Gradio 完全加载
-    setTimeout(setupSidebarToggle, 500);
-    setTimeout(setupSidebarToggle, 1000);
-    setTimeout(setupSidebarToggle, 2000);
-    setInterval(setupSidebarToggle, 3000);
-})();
-</script>
-"""
-
-def create_interface():
     with gr.Blocks(
-        css=custom_css,
         theme=gr.themes.Soft(),
-        head=sidebar_toggle_js + layout_js,
+        head=_static_head(static_url_prefix),
     ) as app:
         # 添加侧边栏 HTML（固定在左侧）
         gr.HTML(sidebar_html)
@@ -1039,53 +378,45 @@ def create_interface():
                 
                 # 上传卡片
                 with gr.Column(elem_classes=["upload-card"]):
-                    gr.HTML("""
-                    <div class="pdf-icon-container">
-                        <div class="pdf-icon">📄</div>
-                    </div>
-                    """)
+                    gr.HTML(pdf_icon_html)
                     
                     # 文件上传组件（隐藏默认样式）
                     file_upload = gr.File(
                         label="",
                         file_types=[".doc", ".docx", ".txt", ".md", ".markdown"],
+                        type="filepath",
                         elem_classes=["hide-gradio-default"]
                     )
                     
                     # 自定义上传按钮和删除按钮（居中显示）
                     with gr.Column():
                         with gr.Row():
-                            gr.HTML('<div style="flex: 1;"></div>')
+                            gr.HTML(spacer_html)
                             upload_btn = gr.Button(
                                 "上传论文文件 ↑",
                                 elem_classes=["upload-button"],
                                 scale=0
                             )
-                            gr.HTML('<div style="flex: 1;"></div>')
+                            gr.HTML(spacer_html)
                         
                         # 删除按钮容器（初始隐藏，紧贴上传按钮）
                         with gr.Row(elem_classes=["delete-button-row"]):
-                            gr.HTML('<div style="flex: 1;"></div>')
+                            gr.HTML(spacer_html)
                             delete_btn = gr.Button(
                                 "删除文件 ✕",
                                 elem_classes=["delete-button"],
                                 scale=0,
                                 visible=False
                             )
-                            gr.HTML('<div style="flex: 1;"></div>')
+                            gr.HTML(spacer_html)
                     
-                    gr.HTML("""
-                    <div class="file-info">
-                        <div>支持文件类型: Word (.doc, .docx) | Markdown (.md, .markdown) | 文本 (.txt)</div>
-                        <div>最大文件大小: 50MB</div>
-                    </div>
-                    """)
+                    gr.HTML(file_info_html)
                     
                     # 期刊类型选择和生成按钮
                     with gr.Row(elem_classes=["model-section"]):
-                        gr.HTML('<div class="model-label">期刊类型</div>')
-                        # 动态获取模板列表
-                        available_templates = get_available_templates()
+                        gr.HTML(model_label_html)
+                        # 动态获取模板列表（后台预取，未就绪时先用默认列表，页面加载后再填充）
+                        available_templates = get_initial_templates()
                         journal_dropdown = gr.Dropdown(
                             choices=available_templates,
                             value=available_templates[0] if available_templates else "自定义模板",
@@ -1147,7 +478,7 @@ def create_interface():
                     if file is not None:
                         return (
                             gr.update(visible=True),  # 显示删除按钮
-                            f"文件已上传: {os.path.basename(file.name)}"
+                            f"文件已上传: {os.path.basename(getattr(file, 'name', file))}"
                         )
                     else:
                         return (
@@ -1178,8 +509,8 @@ def create_interface():
                 )
                 
                 # 预览模板按钮事件
-                def show_template_preview(template_name):
-                    preview_content = preview_template(template_name)
+                async def show_template_preview(template_name):
+                    preview_content = await preview_template_async(template_name)
                     return gr.update(value=preview_content, visible=True)
                 
                 preview_btn.click(
@@ -1188,6 +519,20 @@ def create_interface():
                     outputs=[template_preview]
                 )
                 
+                # 页面加载后用最新的模板列表填充下拉框
+                def load_template_choices(current_value):
+                    templates = get_available_templates()
+                    if current_value in templates:
+                        return gr.update(choices=templates)
+                    return gr.update(choices=templates, value=templates[0] if templates else "自定义模板")
+                
+                app.load(
+                    fn=load_template_choices,
+                    inputs=[journal_dropdown],
+                    outputs=[journal_dropdown],
+                    queue=False,
+                )
+                
                 # 生成按钮状态切换：点击后显示“正在生成中”，完成后恢复
                 def set_generating_state():
                     return gr.update(value="正在生成中", interactive=False)
@@ -1211,14 +556,52 @@ def create_interface():
                     queue=False,
                 )
     
+    # 处理函数以等待后端网络 I/O 为主，可以放宽并发限制
+    app.queue(default_concurrency_limit=8, max_size=64)
     return app
 
 # 向后兼容：保留 create_ui 作为别名
-def create_ui() -> gr.Blocks:
+def create_ui() -> "gr.Blocks":
     """创建 Gradio Web UI（向后兼容别名）"""
     return create_interface()
 
+def create_app():
+    """
+    创建承载 Web UI 的 FastAPI 应用
+    
+    /static 下的 CSS/JS 以 Cache-Control: immutable 提供（URL 带内容哈希），
+    超过 1KB 的响应启用 gzip 压缩，Gradio 界面挂载在根路径。
+    """
+    # 先开始预取模板列表，使目录扫描与下面导入 gradio 的耗时重叠
+    start_template_prefetch()
+
+    import gradio as gr
+    from fastapi import FastAPI
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.staticfiles import StaticFiles
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        # 服务关闭时释放共享 HTTP 客户端的连接池
+        await _ACLIENT.aclose()
+
+    class ImmutableStaticFiles(StaticFiles):
+        """为静态资源添加长期缓存响应头"""
+
+        async def get_response(self, path, scope):
+            response = await super().get_response(path, scope)
+            if response.status_code == 200:
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            return response
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    app.mount(STATIC_URL_PREFIX, ImmutableStaticFiles(directory=STATIC_DIR), name="static")
+    return gr.mount_gradio_app(app, create_interface(STATIC_URL_PREFIX), path="/", show_error=True)
+
 if __name__ == "__main__":
-    app = create_interface()
-    app.launch(server_name="0.0.0.0", server_port=7860, share=False)
+    import uvicorn
+
+    uvicorn.run(create_app(), host="0.0.0.0", port=7860)
 
@@ -2,22 +2,56 @@
 启动 AutoLaTeX 所有服务
 同时启动 FastAPI 后端和 Gradio Web UI
 """
+import atexit
+import signal
 import subprocess
 import sys
 import os
 import time
+import urllib.request
 import webbrowser
-from threading import Thread
 
-def start_api():
-    """启动 FastAPI 后端"""
+API_HEALTH_URL = "http://localhost:8000/api/v1/health"
+REQUIRED_DIRS = ("data/vector_db", "data/uploads", "output", "docs")
+
+def start_api() -> subprocess.Popen:
+    """启动 FastAPI 后端（非阻塞，返回子进程句柄）"""
     print("🚀 正在启动 FastAPI 后端服务...")
-    subprocess.run([sys.executable, "run_api.py"])
+    return subprocess.Popen([sys.executable, "run_api.py"])
+
+def stop_process(proc: subprocess.Popen, timeout: float = 5.0):
+    """终止子进程：先 terminate，超时后 kill，避免残留孤儿进程"""
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+def wait_for_api(timeout: float = 30.0) -> bool:
+    """轮询后端健康检查端点，直到 API 就绪或超时（指数退避，单次间隔最长 1 秒）"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(API_HEALTH_URL, timeout=0.25) as resp:
+                if resp.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return False
 
 def start_ui():
     """启动 Gradio Web UI"""
     # 等待 API 启动
-    time.sleep(3)
+    if wait_for_api():
+        print("✅ FastAPI 后端已就绪")
+    else:
+        print("⚠️  等待 FastAPI 后端超时，仍继续启动 Web UI")
     print("🎨 正在启动 Gradio Web UI...")
     subprocess.run([sys.executable, "run_ui.py"])
 
@@ -27,11 +61,10 @@ def main():
     print("AutoLaTeX 服务启动器")
     print("=" * 50)
     
-    # 创建必要的目录
-    os.makedirs("data/vector_db", exist_ok=True)
-    os.makedirs("data/uploads", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("docs", exist_ok=True)
+    # 创建必要的目录（已存在时跳过，重启时不再重复 mkdir）
+    for directory in REQUIRED_DIRS:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
     
     print("\n📁 目录结构已准备就绪")
     print("\n⚠️  注意：")
@@ -40,9 +73,11 @@ def main():
     print("   - 请确保端口 8000 和 7860 未被占用")
     print("\n" + "=" * 50 + "\n")
     
-    # 启动 API（在后台线程）
-    api_thread = Thread(target=start_api, daemon=True)
-    api_thread.start()
+    # 启动 API（子进程，退出时一并终止）
+    api_proc = start_api()
+    atexit.register(stop_process, api_proc)
+    # SIGTERM 转换为正常退出，以便执行 atexit 清理
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     
     # 启动 UI（主线程）
     start_ui()
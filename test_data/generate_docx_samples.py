@@ -5,8 +5,11 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import numpy as np
 from docx import Document  # type: ignore
 from docx.enum.style import WD_STYLE_TYPE  # type: ignore
+from docx.oxml import OxmlElement  # type: ignore
+from docx.oxml.ns import qn  # type: ignore
 from docx.shared import Inches  # type: ignore
 from PIL import Image, ImageDraw  # type: ignore
 
@@ -24,10 +27,14 @@ def _create_sample_image() -> Path:
     image_path = ASSETS_DIR / "sample_figure.png"
     if image_path.exists():
         return image_path
-    img = Image.new("RGB", (600, 300), color=(46, 134, 222))
-    draw = ImageDraw.Draw(img)
-    draw.rectangle((50, 80, 550, 220), outline="white", width=5)
-    draw.text((70, 130), "AutoTeX Diagram", fill="white")
+    # 背景与边框直接在 NumPy 数组上整块填充，只有文字仍交给 PIL 绘制
+    pixels = np.full((300, 600, 3), (46, 134, 222), dtype=np.uint8)
+    pixels[80:85, 50:551] = 255
+    pixels[216:221, 50:551] = 255
+    pixels[80:221, 50:55] = 255
+    pixels[80:221, 546:551] = 255
+    img = Image.fromarray(pixels)
+    ImageDraw.Draw(img).text((70, 130), "AutoTeX Diagram", fill="white")
     img.save(image_path)
     return image_path
 
@@ -77,16 +84,15 @@ def create_sample_paper_full() -> None:
     table = doc.add_table(rows=4, cols=3)
     table.style = "Light Grid Accent 1"
     headers = ["Module", "Latency (ms)", "Accuracy"]
-    for idx, text in enumerate(headers):
-        table.cell(0, idx).text = text
     data_rows = [
         ["Parser", "32", "0.91"],
         ["OCR", "58", "0.87"],
         ["Renderer", "20", "0.95"],
     ]
-    for row_idx, row_data in enumerate(data_rows, start=1):
-        for col_idx, value in enumerate(row_data):
-            table.cell(row_idx, col_idx).text = value
+    # 新建单元格自带一个空段落，直接追加 run，避免 .text 赋值时删除并重建段落
+    for row, values in zip(table.rows, [headers] + data_rows):
+        for cell, value in zip(row.cells, values):
+            cell.paragraphs[0].add_run(value)
 
     doc.add_paragraph("Figure 1: AutoTeX Architecture")
     image_path = _create_sample_image()
@@ -128,12 +134,50 @@ def create_sample_paper_no_bib() -> None:
     doc.save(BASE_DIR / "sample_paper_no_bib.docx")
 
 
+def _add_content_control(doc: Document, texts: list[str], gallery: str = "") -> None:
+    """在正文末尾追加一个内容控件（w:sdt）；gallery 非空时标记为文档部件（如目录）。"""
+    sdt = OxmlElement("w:sdt")
+    sdt_pr = OxmlElement("w:sdtPr")
+    if gallery:
+        doc_part = OxmlElement("w:docPartObj")
+        part_gallery = OxmlElement("w:docPartGallery")
+        part_gallery.set(qn("w:val"), gallery)
+        doc_part.append(part_gallery)
+        sdt_pr.append(doc_part)
+    sdt.append(sdt_pr)
+    content = OxmlElement("w:sdtContent")
+    sdt.append(content)
+    # 段落先按常规方式追加到正文，再整体移入 sdtContent
+    anchor = doc.add_paragraph()._p
+    anchor.addprevious(sdt)
+    for text in texts:
+        content.append(doc.add_paragraph(text)._p)
+    anchor.getparent().remove(anchor)
+
+
+def create_sample_paper_toc() -> None:
+    doc = Document()
+    doc.add_paragraph("AutoTeX Thesis With Table of Contents").style = "Title"
+    doc.add_paragraph("Grace Liu (BIT)")
+    doc.add_paragraph("Abstract: Document with a Word table of contents and content controls.")
+    _add_content_control(
+        doc, ["目录", "1 Introduction 1", "参考文献 12"], gallery="Table of Contents"
+    )
+    doc.add_heading("1 Introduction", level=1)
+    doc.add_paragraph("The table of contents above must not be parsed as body text.")
+    _add_content_control(doc, ["This paragraph lives inside a plain content control."])
+    doc.add_heading("References", level=1)
+    doc.add_paragraph("[1] Grace Liu. Parsing Word Content Controls. AutoTeX Notes, 2025.")
+    doc.save(BASE_DIR / "sample_paper_toc.docx")
+
+
 def main() -> None:
     _ensure_dirs()
     _create_sample_image()
     create_sample_paper_full()
     create_sample_paper_min()
     create_sample_paper_no_bib()
+    create_sample_paper_toc()
     print(f"Sample DOCX files created under {BASE_DIR}")
 
 
@@ -2,12 +2,6 @@
 测试知识库搜索功能
 """
 import sys
-import os
-
-# 添加 src 目录到 Python 路径
-project_root = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
 
 from autolatex.tools.knowledge_base import knowledge_base_search, initialize_knowledge_base
 
@@ -45,5 +39,10 @@ def test_knowledge_base():
     print("=" * 50)
 
 if __name__ == "__main__":
-    test_knowledge_base()
+    # 关闭行缓冲，诊断输出在脚本结束时统一刷新
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    try:
+        test_knowledge_base()
+    finally:
+        sys.stdout.flush()
 
@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Tuple
 
-import sys
-from pathlib import Path
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
 
-# 添加 src 目录到路径
-project_root = Path(__file__).resolve().parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from autolatex.tools.document_tools import DocumentParserTool
-from autolatex.tools.schema_validator import load_document_schema, validate_parsed_document
+from autolatex.tools.schema_validator import load_document_schema
 
 BASE_DIR = os.path.dirname(__file__)
 DOCX_TEST_DIR = os.path.normpath(os.path.join(BASE_DIR, "../../test_data", "docx_samples"))
@@ -24,12 +27,41 @@ MD_TEST_DIR = os.path.normpath(os.path.join(BASE_DIR, "../../test_data", "md_sam
 TXT_TEST_DIR = os.path.normpath(os.path.join(BASE_DIR, "../../test_data", "txt_samples"))
 IMAGES_DIR = os.path.normpath(os.path.join(BASE_DIR, "../../parsed_images"))
 
+DOCX_CASES = [
+    "sample_paper_full.docx",
+    "sample_paper_min.docx",
+    "sample_paper_no_bib.docx",
+    "sample_paper_toc.docx",
+    "test_improvement.docx",
+    "complex_test.docx"
+]
+MD_CASES = [
+    "sample_paper_with_frontmatter.md",
+    "test_advanced.md"
+]
+TXT_CASES = [
+    "sample_paper_full.txt",
+    "sample_paper_min.txt",
+    "test_advanced.txt"
+]
+TEST_GROUPS: Dict[str, Tuple[str, List[str]]] = {
+    "docx": (DOCX_TEST_DIR, DOCX_CASES),
+    "md": (MD_TEST_DIR, MD_CASES),
+    "txt": (TXT_TEST_DIR, TXT_CASES),
+}
+
+# Schema 与校验器只构建一次，所有用例共用
+_SCHEMA = load_document_schema()
+_VALIDATOR = validator_for(_SCHEMA)(_SCHEMA)
+
+# 解析工具不保存单次运行的状态，所有用例共用一个实例
+_PARSER_TOOL = DocumentParserTool()
+
 
 def run_file_test(file_path: str) -> bool:
-    parser_tool = DocumentParserTool()
     try:
         # _run returns a JSON string with status and path to the saved file
-        response_str = parser_tool._run(file_path)
+        response_str = _PARSER_TOOL._run(file_path)
         
         # Check for error strings that aren't JSON
         if response_str.startswith("Error:"):
@@ -48,18 +80,18 @@ def run_file_test(file_path: str) -> bool:
             return False
 
         # Read the actual parsed content
-        with open(saved_json_path, "r", encoding="utf-8") as f:
-            parsed_dict = json.load(f)
+        with open(saved_json_path, "rb") as f:
+            parsed_dict = _json_loads(f.read())
 
         print(f"--- Parsed output verified at: {saved_json_path} ---")
 
-        schema = load_document_schema()
-        is_valid = validate_parsed_document(parsed_dict, schema)
+        is_valid = _VALIDATOR.is_valid(parsed_dict)
         
         if is_valid:
             print("--- Schema Validation: PASSED ---")
         else:
-            print("--- Schema Validation: FAILED ---")
+            error = best_match(_VALIDATOR.iter_errors(parsed_dict))
+            print(f"--- Schema Validation: FAILED ({error.message}) ---")
             
         return is_valid
     except (FileNotFoundError, ValueError) as exc:
@@ -70,58 +102,61 @@ def run_file_test(file_path: str) -> bool:
         return False
 
 
-def run_docx_tests() -> Dict[str, bool]:
-    results: Dict[str, bool] = {}
-    docx_cases = [
-        "sample_paper_full.docx",
-        "sample_paper_min.docx",
-        "sample_paper_no_bib.docx",
-        "test_improvement.docx",
-        "complex_test.docx"
-    ]
-    for case in docx_cases:
-        file_path = os.path.join(DOCX_TEST_DIR, case)
-        print(f"\n--- Running DOCX test for: {case} ---")
-        if not os.path.exists(file_path):
-            print(f"Test file not found: {file_path}")
-            results[case] = False
-            continue
-        results[case] = run_file_test(file_path)
-    return results
+def _index_dir(directory: str) -> Dict[str, str]:
+    """单次 scandir 建立 {文件名: 路径} 索引，替代逐个用例的 exists 检查。"""
+    if not os.path.isdir(directory):
+        return {}
+    with os.scandir(directory) as entries:
+        return {entry.name: entry.path for entry in entries}
 
 
-def run_md_tests() -> Dict[str, bool]:
-    results: Dict[str, bool] = {}
-    md_cases = [
-        "sample_paper_with_frontmatter.md",
-        "test_advanced.md"
-    ]
-    for case in md_cases:
-        file_path = os.path.join(MD_TEST_DIR, case)
-        print(f"\n--- Running MD test for: {case} ---")
-        if not os.path.exists(file_path):
-            print(f"Test file not found: {file_path}")
-            results[case] = False
-            continue
-        results[case] = run_file_test(file_path)
-    return results
+def _run_file_test_captured(file_path: str) -> Tuple[bool, str]:
+    """在子进程中执行单个用例并捕获其输出，由父进程按用例顺序打印。"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        passed = run_file_test(file_path)
+    return passed, buffer.getvalue()
+
 
+def _collect_cases() -> List[Tuple[str, str, Optional[str]]]:
+    """按 TEST_GROUPS 顺序列出 (分组, 用例, 文件路径)，文件不存在时路径为 None。"""
+    cases: List[Tuple[str, str, Optional[str]]] = []
+    for group, (test_dir, group_cases) in TEST_GROUPS.items():
+        index = _index_dir(test_dir)
+        for case in group_cases:
+            cases.append((group, case, index.get(case)))
+    return cases
 
-def run_txt_tests() -> Dict[str, bool]:
-    results: Dict[str, bool] = {}
-    txt_cases = [
-        "sample_paper_full.txt",
-        "sample_paper_min.txt",
-        "test_advanced.txt"
-    ]
-    for case in txt_cases:
-        file_path = os.path.join(TXT_TEST_DIR, case)
-        print(f"\n--- Running TXT test for: {case} ---")
-        if not os.path.exists(file_path):
-            print(f"Test file not found: {file_path}")
-            results[case] = False
-            continue
-        results[case] = run_file_test(file_path)
+
+def run_all_tests(parallel: bool = True) -> Dict[str, Dict[str, bool]]:
+    """
+    执行所有用例，输出与结果按分组和用例原顺序汇总。
+
+    parallel 为 True 时用进程池并行执行，否则在当前进程中逐个执行（便于调试）。
+    """
+    results: Dict[str, Dict[str, bool]] = {group: {} for group in TEST_GROUPS}
+    cases = _collect_cases()
+    paths = [file_path for _, _, file_path in cases if file_path]
+
+    executor = ProcessPoolExecutor() if parallel else None
+    try:
+        if executor is not None:
+            outputs = executor.map(_run_file_test_captured, paths)
+        for group, case, file_path in cases:
+            print(f"\n--- Running {group.upper()} test for: {case} ---")
+            if not file_path:
+                print(f"Test file not found: {os.path.join(TEST_GROUPS[group][0], case)}")
+                results[group][case] = False
+                continue
+            if executor is None:
+                results[group][case] = run_file_test(file_path)
+                continue
+            passed, output = next(outputs)
+            print(output, end="")
+            results[group][case] = passed
+    finally:
+        if executor is not None:
+            executor.shutdown()
     return results
 
 
@@ -134,9 +169,9 @@ def main() -> None:
     print("Starting document parser tests...")
     ensure_dirs()
 
-    docx_results = run_docx_tests()
-    md_results = run_md_tests()
-    txt_results = run_txt_tests()
+    # 设置 AUTOLATEX_TEST_SERIAL=1 时按顺序逐个执行，便于调试
+    results = run_all_tests(parallel=os.environ.get("AUTOLATEX_TEST_SERIAL") != "1")
+    docx_results, md_results, txt_results = results["docx"], results["md"], results["txt"]
 
     print("\n--- DOCX Test Summary ---")
     for name, passed in docx_results.items():
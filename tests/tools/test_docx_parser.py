@@ -0,0 +1,58 @@
+"""DOCX 解析器针对内容控件（w:sdt）遍历的单元测试。"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List
+
+from autolatex.tools.document_parser.docx_parser import parse_docx_to_json
+
+BASE_DIR = os.path.dirname(__file__)
+TOC_SAMPLE = os.path.normpath(
+    os.path.join(BASE_DIR, "../../test_data", "docx_samples", "sample_paper_toc.docx")
+)
+
+
+def _content_texts(parsed: Dict[str, Any]) -> List[str]:
+    return [item.get("text", "") for item in parsed["content"]]
+
+
+def test_toc_content_control_is_skipped() -> None:
+    parsed = parse_docx_to_json(TOC_SAMPLE)
+    texts = _content_texts(parsed)
+    assert "目录" not in texts, "目录内容控件不应作为正文输出"
+    assert "1 Introduction 1" not in texts, "目录条目不应作为正文输出"
+    assert "Introduction" in texts, "正文标题缺失"
+
+
+def test_toc_does_not_start_bibliography() -> None:
+    parsed = parse_docx_to_json(TOC_SAMPLE)
+    raws = [entry["raw"] for entry in parsed["bibliography"]]
+    assert raws == ["[1] Grace Liu. Parsing Word Content Controls. AutoTeX Notes, 2025."], raws
+
+
+def test_plain_content_control_is_expanded() -> None:
+    parsed = parse_docx_to_json(TOC_SAMPLE)
+    texts = _content_texts(parsed)
+    assert "This paragraph lives inside a plain content control." in texts
+    # 内容控件中的段落保持原始文档顺序
+    assert texts.index("The table of contents above must not be parsed as body text.") < texts.index(
+        "This paragraph lives inside a plain content control."
+    )
+
+
+def main() -> None:
+    cases = [
+        (test_toc_content_control_is_skipped, "TOC content control skipped"),
+        (test_toc_does_not_start_bibliography, "TOC does not start bibliography"),
+        (test_plain_content_control_is_expanded, "plain content control expanded"),
+    ]
+    print("Running DOCX parser tests...")
+    for func, label in cases:
+        func()
+        print(f"  [PASS] {label}")
+    print("All DOCX parser tests passed.")
+
+
+if __name__ == "__main__":
+    main()
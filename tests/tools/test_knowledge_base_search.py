@@ -0,0 +1,98 @@
+"""knowledge_base_search 结果缓存的单元测试：知识库变化后结果应当可见。"""
+
+from __future__ import annotations
+
+from typing import List
+
+from autolatex.knowledge_sync import SyncResult
+from autolatex.tools import knowledge_base as kb
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _patch_search(answers: List[str]):
+    """用依次返回 answers 的函数替换真实搜索，返回还原函数。"""
+    original_search = kb._search_knowledge_base
+    original_monotonic = kb.time.monotonic
+    clock = _Clock()
+    calls = iter(answers)
+    kb._search_knowledge_base = lambda journal_name, n_results: next(calls)
+    kb.time.monotonic = clock
+    kb.clear_search_cache()
+
+    def restore() -> None:
+        kb._search_knowledge_base = original_search
+        kb.time.monotonic = original_monotonic
+        kb.clear_search_cache()
+
+    return clock, restore
+
+
+def test_repeated_search_is_cached() -> None:
+    clock, restore = _patch_search(["未找到", "已找到"])
+    try:
+        assert kb.knowledge_base_search("New Journal", 2) == "未找到"
+        clock.now += kb._SEARCH_CACHE_TTL - 1
+        assert kb.knowledge_base_search("New Journal", 2) == "未找到"
+    finally:
+        restore()
+
+
+def test_db_change_becomes_visible_after_ttl() -> None:
+    # 模拟另一个进程在两次搜索之间写入了新期刊：缓存过期后应返回新结果
+    clock, restore = _patch_search(["未找到", "已找到"])
+    try:
+        assert kb.knowledge_base_search("New Journal", 2) == "未找到"
+        clock.now += kb._SEARCH_CACHE_TTL + 1
+        assert kb.knowledge_base_search("New Journal", 2) == "已找到"
+    finally:
+        restore()
+
+
+def test_initialize_clears_cache_when_it_writes() -> None:
+    clock, restore = _patch_search(["未找到", "已找到"])
+    original_db = kb.VectorDatabase
+    original_sync = kb.sync_templates
+
+    class _FakeDatabase:
+        collection = None
+
+        def __init__(self, persist_directory: str) -> None:
+            pass
+
+        def get_collection_count(self) -> int:
+            return 1
+
+    kb.VectorDatabase = _FakeDatabase
+    kb.sync_templates = lambda collection, templates: SyncResult(added=["New Journal"])
+    try:
+        assert kb.knowledge_base_search("New Journal", 2) == "未找到"
+        kb.initialize_knowledge_base()
+        assert kb.knowledge_base_search("New Journal", 2) == "已找到"
+    finally:
+        kb.VectorDatabase = original_db
+        kb.sync_templates = original_sync
+        restore()
+
+
+def main() -> None:
+    cases = [
+        (test_repeated_search_is_cached, "repeated search cached"),
+        (test_db_change_becomes_visible_after_ttl, "DB change visible after TTL"),
+        (test_initialize_clears_cache_when_it_writes, "initialize clears cache"),
+    ]
+    print("Running knowledge base search cache tests...")
+    for func, label in cases:
+        func()
+        print(f"  [PASS] {label}")
+    print("All knowledge base search cache tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""知识库模板同步（ID、metadata、内容哈希比对）的单元测试。"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from autolatex.knowledge_sync import sync_templates, template_id, template_metadata
+
+
+class InMemoryCollection:
+    """只实现 sync_templates 用到的 get/upsert/delete 的内存集合，并记录调用次数。"""
+
+    def __init__(self) -> None:
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+
+    def get(self, include: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        self.calls.append("get")
+        ids = list(self.rows)
+        return {"ids": ids, "metadatas": [self.rows[i]["metadata"] for i in ids]}
+
+    def upsert(self, documents: List[str], metadatas: List[Dict], ids: List[str]) -> None:
+        self.calls.append("upsert")
+        for doc_id, document, metadata in zip(ids, documents, metadatas):
+            self.rows[doc_id] = {"document": document, "metadata": metadata}
+
+    def delete(self, ids: List[str]) -> None:
+        self.calls.append("delete")
+        for doc_id in ids:
+            self.rows.pop(doc_id, None)
+
+
+TEMPLATES = [
+    {"journal": "IEEE Access", "document": "IEEE Access 模板", "metadata": {"journal_name": "IEEE Access"}},
+    {
+        "journal": "Scientific Reports",
+        "document": "Scientific Reports 模板",
+        "metadata": {"journal_name": "Scientific Reports", "documentclass_options": ["twocolumn"]},
+    },
+]
+
+
+def test_template_id_is_stable_and_distinguishes_spelling() -> None:
+    assert template_id("IEEE Access") == template_id("IEEE Access")
+    assert template_id("IEEE Access").startswith("t_")
+    # 旧方案下这两个名称会映射到同一个 template_ieee_access
+    assert template_id("IEEE Access") != template_id("ieee access")
+
+
+def test_template_metadata_is_cleaned_and_hashed() -> None:
+    metadata = template_metadata(TEMPLATES[1])
+    assert metadata["documentclass_options"] == '["twocolumn"]'
+    assert len(metadata["content_hash"]) == 16
+    changed = copy.deepcopy(TEMPLATES[1])
+    changed["metadata"]["documentclass_options"].append("final")
+    assert template_metadata(changed)["content_hash"] != metadata["content_hash"]
+
+
+def test_sync_adds_then_skips_unchanged() -> None:
+    collection = InMemoryCollection()
+    first = sync_templates(collection, TEMPLATES)
+    assert first.added == ["IEEE Access", "Scientific Reports"]
+    assert set(collection.rows) == {template_id(t["journal"]) for t in TEMPLATES}
+
+    collection.calls.clear()
+    second = sync_templates(collection, TEMPLATES)
+    assert not second.changed
+    assert collection.calls == ["get"], collection.calls
+
+
+def test_sync_upserts_changed_and_removes_only_legacy_ids() -> None:
+    collection = InMemoryCollection()
+    sync_templates(collection, TEMPLATES)
+    collection.rows["template_ieee_access"] = {"document": "旧条目", "metadata": {}}
+    collection.rows["custom_entry"] = {"document": "其他来源", "metadata": {}}
+
+    changed = copy.deepcopy(TEMPLATES)
+    changed[0]["document"] = "IEEE Access 模板（新版）"
+    collection.calls.clear()
+    result = sync_templates(collection, changed)
+
+    assert result.added == []
+    assert result.updated == ["IEEE Access"]
+    assert result.removed == ["template_ieee_access"]
+    assert collection.calls == ["get", "upsert", "delete"], collection.calls
+    assert collection.rows[template_id("IEEE Access")]["document"] == "IEEE Access 模板（新版）"
+    assert "custom_entry" in collection.rows
+
+
+def main() -> None:
+    cases = [
+        (test_template_id_is_stable_and_distinguishes_spelling, "template id"),
+        (test_template_metadata_is_cleaned_and_hashed, "template metadata"),
+        (test_sync_adds_then_skips_unchanged, "sync skips unchanged"),
+        (test_sync_upserts_changed_and_removes_only_legacy_ids, "sync upserts changed"),
+    ]
+    print("Running knowledge sync tests...")
+    for func, label in cases:
+        func()
+        print(f"  [PASS] {label}")
+    print("All knowledge sync tests passed.")
+
+
+if __name__ == "__main__":
+    main()
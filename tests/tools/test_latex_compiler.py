@@ -4,17 +4,10 @@ from __future__ import annotations
 
 import json
 import os
-import sys
 import tempfile
 from pathlib import Path
 from typing import Dict
 
-# 添加 src 目录到路径
-project_root = Path(__file__).resolve().parent.parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
 from autolatex.tools.latex_tools import LaTeXCompilerTool
 from autolatex.tools.latex_compiler import cleanup_temp_dir
 
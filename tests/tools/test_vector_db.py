@@ -0,0 +1,86 @@
+"""VectorDatabase.search 结果格式（SearchHit 与 as_dict 兼容格式）的单元测试。"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from autolatex.tools.vector_db import SearchHit, VectorDatabase
+
+
+class QueryOnlyCollection:
+    """只实现 query 的集合，按 ChromaDB 的格式返回预设结果。"""
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        self.result = result
+        self.queries: List[Dict[str, Any]] = []
+
+    def query(self, query_texts: List[str], n_results: int) -> Dict[str, Any]:
+        self.queries.append({"query_texts": query_texts, "n_results": n_results})
+        return self.result
+
+
+def _database(result: Dict[str, Any]) -> VectorDatabase:
+    # 跳过 __init__，避免创建真实的 ChromaDB 持久化目录
+    db = VectorDatabase.__new__(VectorDatabase)
+    db.collection = QueryOnlyCollection(result)
+    return db
+
+
+FULL_RESULT = {
+    "ids": [["t_1", "t_2"]],
+    "documents": [["IEEE Access 模板", "Nature 模板"]],
+    "metadatas": [[{"journal_name": "IEEE Access"}, None]],
+    "distances": [[0.12, 0.5]],
+}
+
+
+def test_search_returns_search_hits() -> None:
+    db = _database(FULL_RESULT)
+    hits = db.search("IEEE", n_results=2)
+    assert hits == [
+        SearchHit(document="IEEE Access 模板", metadata={"journal_name": "IEEE Access"}, distance=0.12, id="t_1"),
+        # metadata 为 None 时返回空字典
+        SearchHit(document="Nature 模板", metadata={}, distance=0.5, id="t_2"),
+    ], hits
+    assert db.collection.queries == [{"query_texts": ["IEEE"], "n_results": 2}]
+
+
+def test_search_as_dict_keeps_legacy_format() -> None:
+    db = _database(FULL_RESULT)
+    results = db.search("IEEE", n_results=2, as_dict=True)
+    assert results[0] == {
+        "document": "IEEE Access 模板",
+        "metadata": {"journal_name": "IEEE Access"},
+        "distance": 0.12,
+        "id": "t_1",
+    }, results[0]
+    assert all(isinstance(item, dict) for item in results)
+
+
+def test_search_tolerates_missing_fields() -> None:
+    db = _database({"documents": [["仅文档"]], "metadatas": None, "distances": None, "ids": None})
+    assert db.search("x") == [SearchHit(document="仅文档")]
+
+
+def test_search_without_results() -> None:
+    db = _database({"documents": [[]], "metadatas": [[]], "distances": [[]], "ids": [[]]})
+    assert db.search("x") == []
+    assert db.search("x", as_dict=True) == []
+
+
+def main() -> None:
+    cases = [
+        (test_search_returns_search_hits, "search returns SearchHit"),
+        (test_search_as_dict_keeps_legacy_format, "as_dict legacy format"),
+        (test_search_tolerates_missing_fields, "missing fields tolerated"),
+        (test_search_without_results, "empty results"),
+    ]
+    print("Running vector DB tests...")
+    for func, label in cases:
+        func()
+        print(f"  [PASS] {label}")
+    print("All vector DB tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Web UI 调用后端的 _api_call 错误处理单元测试（使用 httpx.MockTransport，不需要启动后端）。"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+import httpx
+
+from autolatex import web_ui
+
+
+def _call_with(handler: Callable[[httpx.Request], httpx.Response], path: str = "/api/v1/journals"):
+    """用 MockTransport 临时替换共享客户端执行一次 _api_call。"""
+
+    async def run():
+        original = web_ui._ACLIENT
+        web_ui._ACLIENT = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await web_ui._api_call("GET", path)
+        finally:
+            await web_ui._ACLIENT.aclose()
+            web_ui._ACLIENT = original
+
+    return asyncio.run(run())
+
+
+def test_success_returns_parsed_json() -> None:
+    ok, data = _call_with(lambda request: httpx.Response(200, json={"journals": ["IEEE Access"]}))
+    assert ok is True
+    assert data == {"journals": ["IEEE Access"]}
+
+
+def test_http_error_shows_fastapi_detail() -> None:
+    ok, message = _call_with(lambda request: httpx.Response(400, json={"detail": "文档文件名不能为空"}))
+    assert ok is False
+    assert "HTTP 400" in message
+    assert message.endswith("文档文件名不能为空"), message
+
+
+def test_large_error_body_is_capped() -> None:
+    body = b"x" * (web_ui._ERROR_BODY_LIMIT * 4)
+    ok, message = _call_with(lambda request: httpx.Response(500, content=body))
+    assert ok is False
+    error_text = message.split(": ", 1)[1]
+    assert error_text == "x" * web_ui._ERROR_BODY_LIMIT + " ...", len(error_text)
+
+
+def test_connect_error_is_reported() -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    ok, message = _call_with(refuse)
+    assert ok is False
+    assert "无法连接到后端服务" in message
+
+
+def test_timeout_is_reported() -> None:
+    def time_out(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    ok, message = _call_with(time_out)
+    assert ok is False
+    assert "请求超时" in message
+
+
+def main() -> None:
+    cases = [
+        (test_success_returns_parsed_json, "success parses JSON"),
+        (test_http_error_shows_fastapi_detail, "HTTP error shows detail"),
+        (test_large_error_body_is_capped, "large error body capped"),
+        (test_connect_error_is_reported, "connect error reported"),
+        (test_timeout_is_reported, "timeout reported"),
+    ]
+    print("Running web UI API call tests...")
+    for func, label in cases:
+        func()
+        print(f"  [PASS] {label}")
+    print("All web UI API call tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,8 @@
 更新知识库脚本
 用于添加新的模板到向量数据库
 """
-import sys
 import os
-
-# 添加 src 目录到 Python 路径
-project_root = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
+import sys
 
 # 直接使用 ChromaDB，避免导入问题
 import chromadb
@@ -38,58 +33,17 @@ def update_knowledge_base():
     print(f"\n当前知识库包含 {existing_count} 个模板")
     
     # 导入知识库数据
+    from autolatex.knowledge_sync import sync_templates
     from autolatex.tools.knowledge_base import LATEX_TEMPLATE_KNOWLEDGE
     
-    # 获取所有现有ID
-    existing_results = collection.get()
-    existing_ids = set(existing_results.get('ids', [])) if existing_results else set()
-    
-    new_templates = []
-    new_documents = []
-    new_metadatas = []
-    new_ids = []
-    
-    # 需要更新的模板（删除旧的后添加新的）
-    templates_to_update = []
-    
-    for item in LATEX_TEMPLATE_KNOWLEDGE:
-        template_id = f"template_{item['journal'].lower().replace(' ', '_')}"
-        if template_id not in existing_ids:
-            new_templates.append(item['journal'])
-            new_documents.append(item["document"])
-            new_metadatas.append(item["metadata"])
-            new_ids.append(template_id)
-        elif item['journal'] == 'BIThesis':
-            # BIThesis 需要更新
-            templates_to_update.append({
-                'id': template_id,
-                'document': item["document"],
-                'metadata': item["metadata"]
-            })
-    
-    # 更新 BIThesis 模板（删除旧的后添加新的）
-    if templates_to_update:
-        for template in templates_to_update:
-            try:
-                # 删除旧的
-                collection.delete(ids=[template['id']])
-                print(f"已删除旧的 {template['id']} 条目")
-            except Exception as e:
-                print(f"删除旧条目时出错（可能不存在）: {e}")
-            # 添加新的
-            new_templates.append('BIThesis (已更新)')
-            new_documents.append(template['document'])
-            new_metadatas.append(template['metadata'])
-            new_ids.append(template['id'])
-    
-    if new_templates or templates_to_update:
-        if new_documents:
-            collection.add(
-                documents=new_documents,
-                metadatas=new_metadatas,
-                ids=new_ids
-            )
-            print(f"\n✅ 新增/更新 {len(new_templates)} 个模板: {', '.join(new_templates)}")
+    # 按内容哈希同步：缺失或有变化的模板一次 upsert，旧 ID 条目一次删除
+    result = sync_templates(collection, LATEX_TEMPLATE_KNOWLEDGE)
+    if result.changed:
+        if result.removed:
+            print(f"已删除旧 ID 方案的 {', '.join(result.removed)} 条目")
+        changed = result.added + [f"{journal} (已更新)" for journal in result.updated]
+        if changed:
+            print(f"\n✅ 新增/更新 {len(changed)} 个模板: {', '.join(changed)}")
         print(f"知识库现在包含 {collection.count()} 个模板")
     else:
         print("\n✅ 所有模板已是最新，无需更新")
@@ -122,4 +76,9 @@ def update_knowledge_base():
     print("=" * 60)
 
 if __name__ == "__main__":
-    update_knowledge_base()
+    # 关闭行缓冲，诊断输出在脚本结束时统一刷新
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    try:
+        update_knowledge_base()
+    finally:
+        sys.stdout.flush()